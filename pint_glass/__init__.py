@@ -12,26 +12,31 @@ Key Features:
 - Zero-Overhead Models: Fields are pure float types at runtime
 """
 
+from typing import TYPE_CHECKING, Any
+
+from pint_glass.asyncio_utils import run_in_system, spawn_request
 from pint_glass.context import (
     SUPPORTED_SYSTEMS,
-    clear_request_cache,
-    get_request_cache,
     get_unit_system,
+    make_system_context,
     reset_unit_system,
-    set_request_cache,
     set_unit_system,
     unit_context,
+    unit_system,
 )
 from pint_glass.core import (
     convert_from_base,
+    convert_from_base_array,
     convert_to_base,
+    convert_to_base_array,
     get_base_unit,
     get_preferred_unit,
-    ureg,
+    get_preferred_unit_obj,
 )
 from pint_glass.dimensions import (
     BASE_SYSTEM,
     DEFAULT_SYSTEM,
+    FLAT_TARGETS,
     TARGET_DIMENSIONS,
     UNIT_SYSTEMS,
     export_dimensions,
@@ -43,11 +48,27 @@ from pint_glass.exceptions import (
 )
 from pint_glass.fields import ModelType, PintGlass
 
+if TYPE_CHECKING:
+    import pint
+
+    ureg: pint.UnitRegistry  # type: ignore[type-arg]
+
 __version__ = "0.1.0"
 
+
+def __getattr__(name: str) -> Any:
+    """Lazily re-export ``ureg`` so importing pint_glass does not build it."""
+    if name == "ureg":
+        from pint_glass import core
+
+        return core.ureg
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     "BASE_SYSTEM",
     "DEFAULT_SYSTEM",
+    "FLAT_TARGETS",
     "SUPPORTED_SYSTEMS",
     "TARGET_DIMENSIONS",
     "UNIT_SYSTEMS",
@@ -56,17 +77,21 @@ __all__ = [
     # Primary API
     "PintGlass",
     "convert_from_base",
+    "convert_from_base_array",
     "convert_to_base",
+    "convert_to_base_array",
     "get_base_unit",
     "get_preferred_unit",
+    "get_preferred_unit_obj",
     # Context helpers
-    "clear_request_cache",
-    "get_request_cache",
     "get_unit_system",
+    "make_system_context",
     "reset_unit_system",
-    "set_request_cache",
+    "run_in_system",
     "set_unit_system",
+    "spawn_request",
     "unit_context",
+    "unit_system",
     # Core utilities
     "ureg",
     # Exceptions
@@ -0,0 +1,77 @@
+"""PintGlass Asyncio Utilities.
+
+Helpers for running coroutines under a given unit system. Each coroutine runs
+as a task in its own context with the unit system already set, so there is no
+set/reset pair to manage and nothing can leak into the caller.
+
+asyncio is imported inside the helpers: this module is re-exported by
+pint_glass, and importing asyncio would otherwise roughly double the
+package's import time for callers that never use it (e.g. the CLI).
+"""
+
+from __future__ import annotations
+
+import contextvars
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from pint_glass.context import make_system_context, set_unit_system
+
+if TYPE_CHECKING:
+    import asyncio
+    from collections.abc import Coroutine
+
+T = TypeVar("T")
+
+
+async def run_in_system(system: str, coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine under the given unit system and return its result.
+
+    The coroutine runs as a task in a copy of the current context with the
+    unit system set, passed explicitly via ``asyncio.create_task(...,
+    context=...)``. The caller's context is never modified.
+
+    Args:
+        system: The unit system for the coroutine (e.g., "imperial", "si").
+        coro: The coroutine to run.
+
+    Returns:
+        The coroutine's result.
+
+    Example:
+        >>> async def pipe_length(value: float) -> float:
+        ...     return PipeData(length=value).length
+        >>> await run_in_system("imperial", pipe_length(10))
+        3.048...
+    """
+    import asyncio
+
+    ctx = contextvars.copy_context()
+    ctx.run(set_unit_system, system)
+    return await asyncio.create_task(coro, context=ctx)
+
+
+def spawn_request(
+    coro: Coroutine[Any, Any, T], system: str | None = None
+) -> asyncio.Task[T]:
+    """Schedule a coroutine as a task with a fresh, empty context.
+
+    Unlike ``asyncio.create_task``, which copies the caller's context, the
+    task starts from a new ``contextvars.Context``: it inherits no context
+    variables at all, so state set by the caller cannot leak into it. The
+    unit system is ``system`` if given, otherwise DEFAULT_SYSTEM.
+
+    Args:
+        coro: The coroutine to run.
+        system: Optional unit system for the task (e.g., "imperial", "si").
+
+    Returns:
+        The scheduled task.
+
+    Example:
+        >>> tasks = [spawn_request(handle(body), "si") for body in bodies]
+        >>> results = await asyncio.gather(*tasks)
+    """
+    import asyncio
+
+    ctx = contextvars.Context() if system is None else make_system_context(system)
+    return asyncio.create_task(coro, context=ctx)
@@ -1,36 +1,98 @@
-"""CLI for PintGlass unit configuration management."""
+"""CLI for PintGlass unit configuration management.
+
+Arguments are parsed by hand rather than with argparse: the interface is a
+single subcommand with one option, and argparse adds noticeable import time
+to every invocation.
+"""
 
-import argparse
 import sys
+from typing import NoReturn
 
 from pint_glass.dimensions import export_dimensions
 
+USAGE = """usage: pint-glass [-h] {export} ...
+
+PintGlass CLI Utility
+
+commands:
+  export                Export unit configuration to JSON
+
+export options:
+  -o, --output OUTPUT   Output file path (default: stdout)"""
+
+
+def _parse_export_args(args: list[str]) -> str | None:
+    """Parse the options of the ``export`` command.
+
+    Args:
+        args: The arguments following ``export``.
+
+    Returns:
+        The output file path, or None to write to stdout.
+
+    Raises:
+        ValueError: If an argument is unknown or an option is missing its value.
+    """
+    output = None
+    i = 0
+    while i < len(args):
+        arg = args[i]
+        if arg in ("-o", "--output"):
+            if i + 1 >= len(args):
+                raise ValueError(f"argument {arg}: expected one argument")
+            output = args[i + 1]
+            i += 2
+        elif arg.startswith("--output="):
+            output = arg.partition("=")[2]
+            i += 1
+        elif arg.startswith("-o"):
+            output = arg[2:]
+            i += 1
+        else:
+            raise ValueError(f"unrecognized arguments: {arg}")
+    return output
+
+
+def _usage_error(message: str) -> NoReturn:
+    """Print usage and an error message to stderr, then exit with status 2."""
+    print(USAGE, file=sys.stderr)
+    print(f"pint-glass: error: {message}", file=sys.stderr)
+    sys.exit(2)
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Main entry point for the pint-glass CLI.
+
+    Args:
+        argv: Command-line arguments without the program name.
+            Defaults to ``sys.argv[1:]``.
+    """
+    args = sys.argv[1:] if argv is None else argv
+
+    if not args or args[0] in ("-h", "--help"):
+        print(USAGE)
+        return
+
+    command, options = args[0], args[1:]
+    if command != "export":
+        _usage_error(f"invalid command '{command}' (choose from 'export')")
+
+    if "-h" in options or "--help" in options:
+        print(USAGE)
+        return
+
+    try:
+        output = _parse_export_args(options)
+    except ValueError as e:
+        _usage_error(str(e))
 
-def main() -> None:
-    """Main entry point for the pint-glass CLI."""
-    parser = argparse.ArgumentParser(description="PintGlass CLI Utility")
-    subparsers = parser.add_subparsers(dest="command", help="Commands")
-
-    # Export command
-    export_parser = subparsers.add_parser(
-        "export", help="Export unit configuration to JSON"
-    )
-    export_parser.add_argument(
-        "-o", "--output", help="Output file path (default: stdout)", default=None
-    )
-
-    args = parser.parse_args()
-
-    if args.command == "export":
-        try:
-            result = export_dimensions(args.output)
-            if not args.output:
-                print(result)
-        except Exception as e:
-            print(f"Error: {e}", file=sys.stderr)
-            sys.exit(1)
-    else:
-        parser.print_help()
+    try:
+        result = export_dimensions(output)
+        if not output:
+            print(result)
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
 
 
 if __name__ == "__main__":
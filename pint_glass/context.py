@@ -6,11 +6,19 @@ Uses Python's contextvars for thread-safe, async-safe context management.
 
 from __future__ import annotations
 
+import difflib
+import sys
 import warnings
-from contextvars import ContextVar, Token
+from contextlib import contextmanager
+from contextvars import Context, ContextVar, Token
+from functools import lru_cache
+from typing import TYPE_CHECKING
 
 from pint_glass.dimensions import DEFAULT_SYSTEM, UNIT_SYSTEMS
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
 # Re-export for backward compatibility
 SUPPORTED_SYSTEMS: frozenset[str] = UNIT_SYSTEMS
 
@@ -18,12 +26,54 @@ SUPPORTED_SYSTEMS: frozenset[str] = UNIT_SYSTEMS
 # Default is fetched from dimensions.py
 unit_context: ContextVar[str] = ContextVar("unit_context", default=DEFAULT_SYSTEM)
 
-# Request-scoped cache for unit conversions (avoids redundant Pint computations)
-# Key: (value, dimension, system, direction), Value: converted float
-# Default is None to avoid shared mutable default issues (lazy init)
-_request_cache: ContextVar[dict[tuple[float, str, str, str], float] | None] = (
-    ContextVar("_request_cache", default=None)
-)
+# Bound methods, looked up once instead of on every call
+_ctx_get = unit_context.get
+_ctx_set = unit_context.set
+
+# Common spellings of each supported system -> canonical lowercase name,
+# e.g. "SI" / "Si" -> "si", so typical header values skip str.lower().
+# The canonical names are the interned strings from UNIT_SYSTEMS, the same
+# objects the factor table keys use, so comparing the context value against
+# them is an identity check.
+_SYSTEM_CANON: dict[str, str] = {}
+for _system in SUPPORTED_SYSTEMS:
+    for _spelling in (_system, _system.upper(), _system.title()):
+        _SYSTEM_CANON[_spelling] = sys.intern(_system)
+
+# Unknown systems that have already been warned about. A misconfigured client
+# sends the same bad value on every request, so warning once is enough; the
+# set is capped so arbitrary header values cannot grow it without bound.
+_warned_systems: set[str] = set()
+_MAX_WARNED_SYSTEMS = 128
+
+
+# Common names for supported systems that are not spelled like them, so
+# fuzzy matching would not find them (e.g. "english" is closest to "engg_si")
+_TYPO_MAP: dict[str, str] = {
+    "metric": "si",
+    "mks": "si",
+    "english": "imperial",
+    "imp": "imperial",
+    "us-customary": "us",
+    "us_customary": "us",
+    "cgs-units": "cgs",
+    "engineering": "engg_si",
+    "oilfield": "engg_field",
+}
+
+
+@lru_cache(maxsize=64)
+def _suggest(system: str) -> str:
+    """Suggest the supported system closest to an unknown one.
+
+    Known aliases are looked up in _TYPO_MAP; anything else is fuzzy-matched,
+    falling back to 'si' when nothing is similar enough.
+    """
+    suggestion = _TYPO_MAP.get(system)
+    if suggestion is not None:
+        return suggestion
+    matches = difflib.get_close_matches(system, sorted(SUPPORTED_SYSTEMS), n=1)
+    return matches[0] if matches else "si"
 
 
 def get_unit_system() -> str:
@@ -36,14 +86,14 @@ def get_unit_system() -> str:
         >>> get_unit_system()
         'imperial'
     """
-    return unit_context.get()
+    return _ctx_get()
 
 
 def set_unit_system(system: str) -> Token[str]:
     """Set the current unit system in context.
 
-    If the system is not in SUPPORTED_SYSTEMS, a warning is emitted and
-    the system falls back to DEFAULT_SYSTEM.
+    If the system is not in SUPPORTED_SYSTEMS, the system falls back to
+    DEFAULT_SYSTEM and a warning is emitted the first time that system is seen.
 
     Args:
         system: The unit system identifier to set (e.g., "imperial", "si").
@@ -59,16 +109,28 @@ def set_unit_system(system: str) -> Token[str]:
         >>> get_unit_system()
         'imperial'
     """
-    system_lower = system.lower()
-    if system_lower not in SUPPORTED_SYSTEMS:
-        warnings.warn(
-            f"Unknown unit system '{system}' — falling back to '{DEFAULT_SYSTEM}'. "
-            f"Supported systems: {sorted(SUPPORTED_SYSTEMS)}. Did you mean 'si'?",
-            UserWarning,
-            stacklevel=2,
-        )
-        system_lower = DEFAULT_SYSTEM
-    return unit_context.set(system_lower)
+    canonical = _SYSTEM_CANON.get(system)
+    if canonical is None:
+        # Looked up again rather than storing system.lower() itself, so the
+        # context always holds the one shared string for each system
+        system_lower = system.lower()
+        canonical = _SYSTEM_CANON.get(system_lower)
+        if canonical is None:
+            if (
+                system_lower not in _warned_systems
+                and len(_warned_systems) < _MAX_WARNED_SYSTEMS
+            ):
+                _warned_systems.add(system_lower)
+                warnings.warn(
+                    f"Unknown unit system '{system}' — falling back to "
+                    f"'{DEFAULT_SYSTEM}'. Supported systems: "
+                    f"{sorted(SUPPORTED_SYSTEMS)}. "
+                    f"Did you mean '{_suggest(system_lower)}'?",
+                    UserWarning,
+                    stacklevel=2,
+                )
+            canonical = DEFAULT_SYSTEM
+    return _ctx_set(canonical)
 
 
 def reset_unit_system(token: Token[str]) -> None:
@@ -86,46 +148,57 @@ def reset_unit_system(token: Token[str]) -> None:
     unit_context.reset(token)
 
 
-def get_request_cache() -> dict[tuple[float, str, str, str], float]:
-    """Get the current request-scoped conversion cache.
-
-    If the cache hasn't been initialized for this context, explicitly
-    initialize it with a new dictionary to avoid shared state issues.
-
-    Returns:
-        The cache dictionary for the current request context.
-    """
-    cache = _request_cache.get()
-    if cache is None:
-        cache = {}
-        _request_cache.set(cache)
-    return cache
+@contextmanager
+def unit_system(system: str) -> Iterator[str]:
+    """Set the unit system for the duration of a ``with`` block.
 
-
-def set_request_cache(
-    cache: dict[tuple[float, str, str, str], float],
-) -> Token[dict[tuple[float, str, str, str], float] | None]:
-    """Set a new request-scoped cache.
+    Wraps the set_unit_system / reset_unit_system pair, so the previous
+    system is restored even if the block raises.
 
     Args:
-        cache: The cache dictionary to set.
+        system: The unit system identifier to set (e.g., "imperial", "si").
 
-    Returns:
-        A token that can be used to reset the cache to its previous value.
+    Yields:
+        The unit system in effect inside the block (after normalization and
+        the unknown-system fallback).
+
+    Example:
+        >>> with unit_system("imperial"):
+        ...     PipeRequest(length=10).length
+        3.048
+        >>> get_unit_system()
+        'engg_si'
     """
-    return _request_cache.set(cache)
+    token = set_unit_system(system)
+    try:
+        yield _ctx_get()
+    finally:
+        unit_context.reset(token)
 
 
-def clear_request_cache() -> Token[dict[tuple[float, str, str, str], float] | None]:
-    """Clear the request-scoped cache by resetting it to None.
+def make_system_context(system: str) -> Context:
+    """Create a new, empty context with the unit system already set.
 
-    This forces a fresh dictionary to be created (lazily) on the next
-    call to get_request_cache().
+    Pass it to ``asyncio.create_task(..., context=...)`` (or call
+    ``Context.run`` on it) to run code under the unit system without a
+    set_unit_system / reset_unit_system pair around it. The context is fresh
+    rather than a copy of the current one, so it inherits no other context
+    variables. Build it once and hand each task ``ctx.copy()``, so that
+    context variables set inside one task are not seen by the others.
+
+    Args:
+        system: The unit system for the context (e.g., "imperial", "si").
+            Unknown systems fall back to DEFAULT_SYSTEM as in set_unit_system.
 
     Returns:
-        A token that can be used to reset the cache to its previous value.
+        A context in which get_unit_system() returns the given system.
 
-    Note:
-        Call this at the start of each request to ensure isolation.
+    Example:
+        >>> si_ctx = make_system_context("si")
+        >>> si_ctx.run(get_unit_system)
+        'si'
+        >>> task = asyncio.create_task(handle(body), context=si_ctx.copy())
     """
-    return _request_cache.set(None)
+    ctx = Context()
+    ctx.run(set_unit_system, system)
+    return ctx
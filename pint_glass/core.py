@@ -7,18 +7,171 @@ units in different unit systems (Imperial, SI).
 
 from __future__ import annotations
 
-import pint
+import sys
+import threading
+from functools import cache, lru_cache
+from typing import TYPE_CHECKING, Any
 
-from pint_glass.context import get_request_cache
 from pint_glass.dimensions import (
     BASE_SYSTEM,
     DEFAULT_SYSTEM,
+    UNIT_SYSTEMS,
+    _FLAT_TARGETS as FLAT_TARGETS,
     _TARGET_DIMENSIONS_RAW as TARGET_DIMENSIONS,
 )
 from pint_glass.exceptions import UnitConversionError, UnsupportedDimensionError
 
-# Singleton UnitRegistry instance
-ureg: pint.UnitRegistry = pint.UnitRegistry()  # type: ignore[type-arg]
+if TYPE_CHECKING:
+    import numpy as np
+    import numpy.typing as npt
+    import pint
+
+# Singleton UnitRegistry instance, created on first use (see _get_ureg).
+# Importing pint and parsing its unit definitions takes hundreds of ms, which
+# processes that never convert (e.g. the CLI) should not pay for.
+_ureg: pint.UnitRegistry | None = None  # type: ignore[type-arg]
+
+# Guards the one-time lazy setup (the registry and the factor tables), so
+# threads doing their first conversion at the same time neither build twice
+# nor read a half-built table. Reentrant: building the tables needs the
+# registry.
+_init_lock = threading.RLock()
+
+# Known dimension spellings -> normalized key
+# e.g. "mass_flow_rate", "Mass Flow Rate" and "MASS_FLOW_RATE" -> "mass_flow_rate"
+_NORMALIZED: dict[str, str] = {}
+for _dim in TARGET_DIMENSIONS:
+    _spaced = _dim.replace("_", " ")
+    for _spelling in (_dim, _dim.upper(), _spaced, _spaced.title(), _spaced.upper()):
+        _NORMALIZED[_spelling] = sys.intern(_dim)
+
+
+def _get_ureg() -> pint.UnitRegistry:  # type: ignore[type-arg]
+    """Get the singleton UnitRegistry, creating it on first use."""
+    global _ureg  # noqa: PLW0603
+    if _ureg is None:
+        with _init_lock:
+            if _ureg is None:
+                import pint
+
+                _ureg = pint.UnitRegistry()
+    return _ureg
+
+
+def __getattr__(name: str) -> Any:
+    """Lazily expose ``ureg`` as a module attribute (PEP 562)."""
+    if name == "ureg":
+        return _get_ureg()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@lru_cache(maxsize=256)
+def _resolve_key(dimension: str, system: str) -> tuple[str, str]:
+    """Normalize a (dimension, system) pair into a lookup table key.
+
+    Cached, so each non-canonical spelling (e.g. "Mass Flow Rate", "SI") is
+    normalized once. Bounded, since system names can come from request input.
+
+    Raises:
+        UnsupportedDimensionError: If the dimension is not supported.
+    """
+    dim_normalized = _NORMALIZED.get(dimension)
+    if dim_normalized is None:
+        # Slow path for other spellings: "TEMPERATURE" -> "temperature"
+        dim_normalized = sys.intern(dimension.lower().replace(" ", "_"))
+        if dim_normalized not in TARGET_DIMENSIONS:
+            supported = ", ".join(f"'{d}'" for d in TARGET_DIMENSIONS.keys())
+            raise UnsupportedDimensionError(
+                f"Unsupported dimension '{dimension}'; supported: {supported}"
+            )
+
+    system_lower = system.lower()
+    if system_lower not in UNIT_SYSTEMS:
+        # Fallback to default if system not recognized
+        system_lower = DEFAULT_SYSTEM
+
+    return dim_normalized, system_lower
+
+
+@cache
+def _parse_unit(unit: str) -> pint.Unit:
+    """Parse a unit string with the shared registry, once per distinct string.
+
+    The same unit strings recur across dimensions and systems (and as both
+    source and target when building the factor tables), so each is handed to
+    Pint's parser only once.
+
+    Raises:
+        pint.UndefinedUnitError: If the unit is not defined.
+    """
+    return _get_ureg().Unit(unit)
+
+
+def _affine_factors(
+    dimension: str, source_unit: str, target_unit: str
+) -> tuple[float, float]:
+    """Get (scale, offset) such that ``target = scale * source + offset``.
+
+    Probing the conversion at 0 and at a second point recovers the affine map,
+    which also covers offset units such as degF and degC. For those the slope
+    is probed far from zero so that subtracting the offset does not cost
+    precision.
+
+    Raises:
+        UnitConversionError: If Pint cannot convert between the units.
+    """
+    import pint
+
+    ureg = _get_ureg()
+    try:
+        source, target = _parse_unit(source_unit), _parse_unit(target_unit)
+        offset = ureg.Quantity(0.0, source).to(target).magnitude
+        probe = 1.0 if offset == 0 else 1e6
+        shifted = ureg.Quantity(probe, source).to(target).magnitude
+        scale = (shifted - offset) / probe
+    except (pint.UndefinedUnitError, pint.DimensionalityError) as e:
+        raise UnitConversionError(
+            f"Conversion failed for dimension '{dimension}' "
+            f"from '{source_unit}' to '{target_unit}': {e}"
+        ) from e
+    return float(scale), float(offset)
+
+
+# Conversion factors per (dimension, system), computed once so a conversion is
+# a single multiply-add instead of building and converting a Pint Quantity.
+# Filled on the first conversion by _build_factor_tables().
+_FACTORS_TO_BASE: dict[tuple[str, str], tuple[float, float]] = {}
+_FACTORS_FROM_BASE: dict[tuple[str, str], tuple[float, float]] = {}
+
+
+def _build_factor_tables() -> None:
+    """Populate the conversion factor tables for every (dimension, system).
+
+    The factors are computed into local dicts and published only once all of
+    them succeeded, so the shared tables are either empty or complete: never
+    half-filled for other threads to read, nor left partial by an error.
+    Callers hold _init_lock.
+    """
+    to_base: dict[tuple[str, str], tuple[float, float]] = {}
+    from_base: dict[tuple[str, str], tuple[float, float]] = {}
+    for (dim, system), unit in FLAT_TARGETS.items():
+        base_unit = FLAT_TARGETS[(dim, BASE_SYSTEM)]
+        to_base[(dim, system)] = _affine_factors(dim, unit, base_unit)
+        from_base[(dim, system)] = _affine_factors(dim, base_unit, unit)
+    _FACTORS_TO_BASE.update(to_base)
+    _FACTORS_FROM_BASE.update(from_base)
+
+
+def _lookup_factors(
+    table: dict[tuple[str, str], tuple[float, float]], dimension: str, system: str
+) -> tuple[float, float]:
+    """Slow path for a factor table miss: build the tables, normalize the key."""
+    if not table:
+        with _init_lock:
+            # Another thread may have built the tables while we waited
+            if not table:
+                _build_factor_tables()
+    return table[_resolve_key(dimension, system)]
 
 
 def get_preferred_unit(dimension: str, system: str) -> str:
@@ -35,23 +188,34 @@ def get_preferred_unit(dimension: str, system: str) -> str:
         KeyError: If the dimension is not supported.
         KeyError: If the system is not supported for this dimension.
     """
-    # Normalize dimension: "Temperature" -> "temperature", "Mass Flow Rate" -> "mass_flow_rate"
-    dim_normalized = dimension.lower().replace(" ", "_")
+    unit = FLAT_TARGETS.get((dimension, system))
+    if unit is None:
+        unit = FLAT_TARGETS[_resolve_key(dimension, system)]
+    return unit
 
-    if dim_normalized not in TARGET_DIMENSIONS:
-        supported = ", ".join(f"'{d}'" for d in TARGET_DIMENSIONS.keys())
-        raise UnsupportedDimensionError(
-            f"Unsupported dimension '{dimension}'; supported: {supported}"
-        )
 
-    system_lower = system.lower()
-    dim_units = TARGET_DIMENSIONS[dim_normalized]
+def get_preferred_unit_obj(dimension: str, system: str) -> pint.Unit:
+    """Get the preferred unit for a dimension as a parsed Pint Unit.
 
-    if system_lower not in dim_units:
-        # Fallback to default if system not recognized
-        system_lower = DEFAULT_SYSTEM
+    Like :func:`get_preferred_unit`, but returns the ``pint.Unit`` parsed by
+    the shared registry, for callers that build Quantities themselves. Each
+    unit string is parsed once and the Unit object reused afterwards.
 
-    return dim_units[system_lower]
+    Args:
+        dimension: The physical dimension key (e.g., "pressure", "length")
+        system: The unit system identifier (e.g., "imperial", "si")
+
+    Returns:
+        The pint.Unit for the given dimension and system.
+
+    Raises:
+        UnsupportedDimensionError: If the dimension is not supported.
+
+    Example:
+        >>> get_preferred_unit_obj("pressure", "imperial")
+        <Unit('pound_force_per_square_inch')>
+    """
+    return _parse_unit(get_preferred_unit(dimension, system))
 
 
 def get_base_unit(dimension: str) -> str:
@@ -66,14 +230,17 @@ def get_base_unit(dimension: str) -> str:
     Raises:
         KeyError: If the dimension is not supported.
     """
-    return get_preferred_unit(dimension, BASE_SYSTEM)
+    unit = FLAT_TARGETS.get((dimension, BASE_SYSTEM))
+    if unit is None:
+        unit = FLAT_TARGETS[_resolve_key(dimension, BASE_SYSTEM)]
+    return unit
 
 
 def convert_to_base(value: float, dimension: str, system: str) -> float:
     """Convert a value from the preferred unit system to the base (SI) unit.
 
     This is used during input validation to store values in a consistent format.
-    Uses request-scoped caching to avoid redundant Pint computations.
+    Uses precomputed conversion factors, so no Pint work happens per call.
 
     Args:
         value: The numeric value in the source unit system.
@@ -87,34 +254,19 @@ def convert_to_base(value: float, dimension: str, system: str) -> float:
         >>> convert_to_base(14.7, "pressure", "imperial")
         101352.932...  # 14.7 psi in pascals
     """
-    cache_key = (value, dimension, system, "to_base")
-    cache = get_request_cache()
-
-    if cache_key in cache:
-        return cache[cache_key]
+    factors = _FACTORS_TO_BASE.get((dimension, system))
+    if factors is None:
+        factors = _lookup_factors(_FACTORS_TO_BASE, dimension, system)
 
-    source_unit = get_preferred_unit(dimension, system)
-    target_unit = get_base_unit(dimension)
-
-    # Create quantity and convert
-    try:
-        quantity = ureg.Quantity(value, source_unit)
-        converted = quantity.to(target_unit)
-    except (pint.UndefinedUnitError, pint.DimensionalityError) as e:
-        raise UnitConversionError(
-            f"Conversion failed for dimension '{dimension}' from '{source_unit}' to '{target_unit}': {e}"
-        ) from e
-
-    result = float(converted.magnitude)
-    cache[cache_key] = result
-    return result
+    scale, offset = factors
+    return scale * value + offset
 
 
 def convert_from_base(value: float, dimension: str, system: str) -> float:
     """Convert a value from the base (SI) unit to the preferred unit system.
 
     This is used during serialization to return values in the user's preferred format.
-    Uses request-scoped caching to avoid redundant Pint computations.
+    Uses precomputed conversion factors, so no Pint work happens per call.
 
     Args:
         value: The numeric value in SI base units.
@@ -128,24 +280,88 @@ def convert_from_base(value: float, dimension: str, system: str) -> float:
         >>> convert_from_base(101325, "pressure", "imperial")
         14.695...  # 101325 pascals in psi
     """
-    cache_key = (value, dimension, system, "from_base")
-    cache = get_request_cache()
+    factors = _FACTORS_FROM_BASE.get((dimension, system))
+    if factors is None:
+        factors = _lookup_factors(_FACTORS_FROM_BASE, dimension, system)
+
+    scale, offset = factors
+    return scale * value + offset
+
+
+def _apply_factors_array(
+    values: npt.ArrayLike,
+    factors: tuple[float, float],
+    out: npt.NDArray[np.float64] | None,
+) -> npt.NDArray[np.float64]:
+    """Compute ``scale * values + offset`` with at most one temporary array."""
+    import numpy as np
+
+    scale, offset = factors
+    result = np.multiply(np.asarray(values, dtype=np.float64), scale, out=out)
+    if offset:
+        # Only offset units (degC, degF) need the second pass
+        np.add(result, offset, out=result)
+    return result
 
-    if cache_key in cache:
-        return cache[cache_key]
 
-    source_unit = get_base_unit(dimension)
-    target_unit = get_preferred_unit(dimension, system)
+def convert_to_base_array(
+    values: npt.ArrayLike,
+    dimension: str,
+    system: str,
+    out: npt.NDArray[np.float64] | None = None,
+) -> npt.NDArray[np.float64]:
+    """Convert an array of values from the preferred unit system to SI base units.
 
-    # Create quantity and convert
-    try:
-        quantity = ureg.Quantity(value, source_unit)
-        converted = quantity.to(target_unit)
-    except (pint.UndefinedUnitError, pint.DimensionalityError) as e:
-        raise UnitConversionError(
-            f"Conversion failed for dimension '{dimension}' from '{source_unit}' to '{target_unit}': {e}"
-        ) from e
+    Vectorized counterpart of :func:`convert_to_base` for list-valued payloads:
+    the conversion factors are resolved once and applied to every element in
+    a single NumPy operation. Requires NumPy (``pint-glass[numpy]``).
 
-    result = float(converted.magnitude)
-    cache[cache_key] = result
-    return result
+    Args:
+        values: Numeric values (list, tuple or array) in the source unit system.
+        dimension: The physical dimension key.
+        system: The source unit system.
+        out: Optional float64 array to write the result into. May be ``values``
+            itself to convert in place.
+
+    Returns:
+        A float64 array of the values converted to SI base units (``out`` if
+        given).
+
+    Example:
+        >>> convert_to_base_array([1, 10], "length", "imperial")
+        array([0.3048, 3.048 ])
+    """
+    factors = _FACTORS_TO_BASE.get((dimension, system))
+    if factors is None:
+        factors = _lookup_factors(_FACTORS_TO_BASE, dimension, system)
+
+    return _apply_factors_array(values, factors, out)
+
+
+def convert_from_base_array(
+    values: npt.ArrayLike,
+    dimension: str,
+    system: str,
+    out: npt.NDArray[np.float64] | None = None,
+) -> npt.NDArray[np.float64]:
+    """Convert an array of SI base unit values to the preferred unit system.
+
+    Vectorized counterpart of :func:`convert_from_base`. Requires NumPy
+    (``pint-glass[numpy]``).
+
+    Args:
+        values: Numeric values (list, tuple or array) in SI base units.
+        dimension: The physical dimension key.
+        system: The target unit system.
+        out: Optional float64 array to write the result into. May be ``values``
+            itself to convert in place.
+
+    Returns:
+        A float64 array of the values converted to the target unit system
+        (``out`` if given).
+    """
+    factors = _FACTORS_FROM_BASE.get((dimension, system))
+    if factors is None:
+        factors = _lookup_factors(_FACTORS_FROM_BASE, dimension, system)
+
+    return _apply_factors_array(values, factors, out)
@@ -7,7 +7,15 @@ corresponding units in Imperial and SI systems.
 
 from __future__ import annotations
 
-from typing import TypedDict, get_type_hints
+import sys
+from functools import cache, lru_cache
+from types import MappingProxyType
+from typing import TYPE_CHECKING, TypedDict, cast
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    import pint
 
 
 class UnitMapping(TypedDict):
@@ -30,13 +38,13 @@ class UnitMapping(TypedDict):
     engg_field: str
 
 
-# Dynamically extract supported unit systems from UnitMapping keys
-
+# Supported unit systems: the keys of UnitMapping, spelled out rather than
+# derived with get_type_hints() at import time. A test keeps the two in sync.
 
-# This ensures UNIT_SYSTEMS stays in sync with the TypedDict definition
 
-
-UNIT_SYSTEMS: frozenset[str] = frozenset(get_type_hints(UnitMapping).keys())
+UNIT_SYSTEMS: frozenset[str] = frozenset(
+    ("imperial", "si", "cgs", "us", "engg_si", "engg_field")
+)
 
 
 # Default unit system to use when none is specified or recognized
@@ -265,8 +273,50 @@ _TARGET_DIMENSIONS_RAW: dict[str, UnitMapping] = {
 }
 
 
+# Flattened view of _TARGET_DIMENSIONS_RAW: (dimension, system) -> unit string.
+# This is the canonical lookup for conversions: interned tuple keys make
+# resolving a unit a single dict probe instead of two nested lookups.
+_FLAT_TARGETS: dict[tuple[str, str], str] = {
+    (sys.intern(dim), sys.intern(system)): unit
+    for dim, unit_map in _TARGET_DIMENSIONS_RAW.items()
+    for system, unit in cast("dict[str, str]", unit_map).items()
+}
+
+# Public read-only view. Core reads the dict directly, and the factor tables
+# and PintGlass types are derived from it once, so it must not be mutated.
+FLAT_TARGETS: Mapping[tuple[str, str], str] = MappingProxyType(_FLAT_TARGETS)
+
+
+@lru_cache(maxsize=1)
+def _pretty_ureg() -> pint.UnitRegistry:  # type: ignore[type-arg]
+    """Get the UnitRegistry used for formatting, creating it on first use.
+
+    Kept separate from the conversion registry in core to avoid side effects
+    and circular imports.
+    """
+    import pint
+
+    return pint.UnitRegistry()
+
+
+@cache
+def _pretty_unit(unit_str: str) -> str:
+    """Format a unit string in short pretty form (e.g., "meter ** 2" -> "m²").
+
+    Cached because the same unit string recurs across systems and dimensions.
+
+    Raises:
+        pint.PintError: If pint cannot parse or format the unit.
+    """
+    # ~P: Short Pretty format (e.g., km/h, m², etc.)
+    return format(_pretty_ureg().Unit(unit_str), "~P")
+
+
 def get_pretty_dimensions() -> dict[str, dict[str, str]]:
-    """Get a pretty-formatted version of TARGET_DIMENSIONS.
+    """Get a pretty-formatted version of the raw dimension table.
+
+    Builds a pint UnitRegistry, so this is slow; TARGET_DIMENSIONS holds the
+    pre-generated result (see scripts/gen_pretty_dims.py).
 
     Returns:
         A dictionary with the same structure as TARGET_DIMENSIONS, but with:
@@ -277,23 +327,15 @@ def get_pretty_dimensions() -> dict[str, dict[str, str]]:
 
     import pint
 
-    # Create a local registry to avoid side effects or circular imports
-    ureg: pint.UnitRegistry = pint.UnitRegistry()
-
     pretty_dims = {}
     for dim_key, unit_map in _TARGET_DIMENSIONS_RAW.items():
         # Convert key: "mass_flow_rate" -> "Mass Flow Rate"
         pretty_key = dim_key.replace("_", " ").title()
 
         pretty_map = {}
-        # Iterate over the UnitMapping (typed dict behaves like dict at runtime)
-        for system, unit_str in unit_map.items():
+        for system, unit_str in cast("dict[str, str]", unit_map).items():
             try:
-                # Create a Unit object and format it
-                # ~P: Short Pretty format (e.g., km/h, m², etc.)
-                unit_obj = ureg.Unit(unit_str)
-                pretty_unit = format(unit_obj, "~P")
-                pretty_map[system] = pretty_unit
+                pretty_map[system] = _pretty_unit(unit_str)
             except pint.PintError as e:
                 # If pint fails to parse or format, keep original string and warn
                 warnings.warn(
@@ -309,7 +351,226 @@ def get_pretty_dimensions() -> dict[str, dict[str, str]]:
     return pretty_dims
 
 
-TARGET_DIMENSIONS: dict[str, dict[str, str]] = get_pretty_dimensions()
+# Pretty-formatted copy of _TARGET_DIMENSIONS_RAW, i.e. the output of
+# get_pretty_dimensions(). Stored as a literal so that importing this module
+# does not build a pint UnitRegistry; regenerate after changing the raw table.
+# BEGIN GENERATED by scripts/gen_pretty_dims.py - do not edit by hand
+_PRETTY_DIMENSIONS: dict[str, dict[str, str]] = {
+    "Pressure": {
+        "imperial": "psi",
+        "si": "Pa",
+        "cgs": "Ba",
+        "us": "psi",
+        "engg_si": "bar",
+        "engg_field": "psi",
+    },
+    "Length": {
+        "imperial": "ft",
+        "si": "m",
+        "cgs": "cm",
+        "us": "ft",
+        "engg_si": "m",
+        "engg_field": "ft",
+    },
+    "Small Length": {
+        "imperial": "in",
+        "si": "mm",
+        "cgs": "mm",
+        "us": "in",
+        "engg_si": "mm",
+        "engg_field": "in",
+    },
+    "Temperature": {
+        "imperial": "°F",
+        "si": "K",
+        "cgs": "°C",
+        "us": "°F",
+        "engg_si": "°C",
+        "engg_field": "°F",
+    },
+    "Mass": {
+        "imperial": "lb",
+        "si": "kg",
+        "cgs": "g",
+        "us": "lb",
+        "engg_si": "kg",
+        "engg_field": "lb",
+    },
+    "Time": {
+        "imperial": "s",
+        "si": "s",
+        "cgs": "s",
+        "us": "s",
+        "engg_si": "s",
+        "engg_field": "s",
+    },
+    "Current": {
+        "imperial": "A",
+        "si": "A",
+        "cgs": "A",
+        "us": "A",
+        "engg_si": "A",
+        "engg_field": "A",
+    },
+    "Luminosity": {
+        "imperial": "cd",
+        "si": "cd",
+        "cgs": "cd",
+        "us": "cd",
+        "engg_si": "cd",
+        "engg_field": "cd",
+    },
+    "Substance": {
+        "imperial": "mol",
+        "si": "mol",
+        "cgs": "mol",
+        "us": "mol",
+        "engg_si": "mol",
+        "engg_field": "mol",
+    },
+    "Area": {
+        "imperial": "ft²",
+        "si": "m²",
+        "cgs": "cm²",
+        "us": "ft²",
+        "engg_si": "m²",
+        "engg_field": "ft²",
+    },
+    "Volume": {
+        "imperial": "ft³",
+        "si": "m³",
+        "cgs": "cm³",
+        "us": "ft³",
+        "engg_si": "m³",
+        "engg_field": "ft³",
+    },
+    "Frequency": {
+        "imperial": "Hz",
+        "si": "Hz",
+        "cgs": "Hz",
+        "us": "Hz",
+        "engg_si": "Hz",
+        "engg_field": "Hz",
+    },
+    "Wavenumber": {
+        "imperial": "1/ft",
+        "si": "1/m",
+        "cgs": "1/cm",
+        "us": "1/ft",
+        "engg_si": "1/m",
+        "engg_field": "1/ft",
+    },
+    "Velocity": {
+        "imperial": "ft/s",
+        "si": "m/s",
+        "cgs": "cm/s",
+        "us": "ft/s",
+        "engg_si": "m/s",
+        "engg_field": "ft/s",
+    },
+    "Speed": {
+        "imperial": "ft/s",
+        "si": "m/s",
+        "cgs": "cm/s",
+        "us": "ft/s",
+        "engg_si": "m/s",
+        "engg_field": "ft/s",
+    },
+    "Mass Flow Rate": {
+        "imperial": "lb/s",
+        "si": "kg/s",
+        "cgs": "g/s",
+        "us": "lb/s",
+        "engg_si": "kg/h",
+        "engg_field": "lb/h",
+    },
+    "Volumetric Flow Rate": {
+        "imperial": "ft³/s",
+        "si": "m³/s",
+        "cgs": "cm³/s",
+        "us": "ft³/s",
+        "engg_si": "m³/h",
+        "engg_field": "ft³/h",
+    },
+    "Acceleration": {
+        "imperial": "ft/s²",
+        "si": "m/s²",
+        "cgs": "cm/s²",
+        "us": "ft/s²",
+        "engg_si": "m/s²",
+        "engg_field": "ft/s²",
+    },
+    "Force": {
+        "imperial": "lbf",
+        "si": "N",
+        "cgs": "dyn",
+        "us": "lbf",
+        "engg_si": "N",
+        "engg_field": "lbf",
+    },
+    "Energy": {
+        "imperial": "ft_lb",
+        "si": "J",
+        "cgs": "erg",
+        "us": "ft_lb",
+        "engg_si": "J",
+        "engg_field": "ft_lb",
+    },
+    "Power": {
+        "imperial": "ft_lb/s",
+        "si": "W",
+        "cgs": "erg/s",
+        "us": "ft_lb/s",
+        "engg_si": "W",
+        "engg_field": "ft_lb/s",
+    },
+    "Momentum": {
+        "imperial": "ft·lb/s",
+        "si": "kg·m/s",
+        "cgs": "cm·g/s",
+        "us": "ft·lb/s",
+        "engg_si": "kg·m/s",
+        "engg_field": "ft·lb/s",
+    },
+    "Density": {
+        "imperial": "lb/ft³",
+        "si": "kg/m³",
+        "cgs": "g/cm³",
+        "us": "lb/ft³",
+        "engg_si": "kg/m³",
+        "engg_field": "lb/ft³",
+    },
+    "Torque": {
+        "imperial": "ft_lb",
+        "si": "m·N",
+        "cgs": "cm·dyn",
+        "us": "ft_lb",
+        "engg_si": "m·N",
+        "engg_field": "ft_lb",
+    },
+    "Viscosity": {
+        "imperial": "lb/ft/s",
+        "si": "Pa·s",
+        "cgs": "P",
+        "us": "lb/ft/s",
+        "engg_si": "Pa·s",
+        "engg_field": "lb/ft/s",
+    },
+    "Kinematic Viscosity": {
+        "imperial": "sq_ft/s",
+        "si": "m²/s",
+        "cgs": "St",
+        "us": "sq_ft/s",
+        "engg_si": "m²/s",
+        "engg_field": "sq_ft/s",
+    },
+}
+# END GENERATED
+
+# Read-only view: consumers share the one table and never need defensive copies
+TARGET_DIMENSIONS: Mapping[str, Mapping[str, str]] = MappingProxyType(
+    {dim: MappingProxyType(units) for dim, units in _PRETTY_DIMENSIONS.items()}
+)
 
 
 def export_dimensions(output_path: str | None = None) -> str:
@@ -326,7 +587,7 @@ def export_dimensions(output_path: str | None = None) -> str:
     config = {
         "systems": sorted(list(UNIT_SYSTEMS)),
         "dimensions": {
-            dim.lower(): systems for dim, systems in TARGET_DIMENSIONS.items()
+            dim.lower(): dict(systems) for dim, systems in TARGET_DIMENSIONS.items()
         },
     }
     json_str = json.dumps(config, indent=2, ensure_ascii=False)
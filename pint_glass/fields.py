@@ -6,13 +6,21 @@ annotated types with automatic unit conversion based on context.
 
 from __future__ import annotations
 
+from functools import cache
 from typing import TYPE_CHECKING, Annotated, Any, Literal
 
 from pydantic import BeforeValidator, PlainSerializer
 
-from pint_glass.context import get_unit_system
-from pint_glass.core import convert_from_base, convert_to_base
-from pint_glass.exceptions import UnitConversionError, UnsupportedDimensionError
+from pint_glass.context import unit_context
+from pint_glass.core import (
+    _FACTORS_FROM_BASE,
+    _FACTORS_TO_BASE,
+    _resolve_key,
+    convert_from_base,
+    convert_to_base,
+)
+from pint_glass.dimensions import BASE_SYSTEM
+from pint_glass.exceptions import PintGlassError
 
 # Type alias for model type
 ModelType = Literal["Input", "Output"]
@@ -26,77 +34,138 @@ else:
     def PintGlass(dimension: str, model_type: ModelType) -> Any:  # noqa: N802
         """Create an annotated type for a Pydantic field with automatic unit conversion.
 
-    This factory function returns an `Annotated[float, ...]` type that converts
-    between the user's preferred unit system and SI base units.
-
-    Conversion direction depends on model_type:
-    - "Input": Converts from preferred unit system → SI base units (for request models)
-    - "Output": SI base units → preferred unit system (for response models)
-
-    Args:
-        dimension: Physical dimension key (e.g., "pressure", "length")
-        model_type: The model type - "Input" or "Output".
-            - "Input": User sends preferred units, stored as SI
-            - "Output": Stored as SI, serialized to preferred units
-
-    Returns:
-        An Annotated type suitable for use as a Pydantic field type.
-
-    Example:
-        >>> from pydantic import BaseModel
-        >>> from pint_glass import PintGlass, set_unit_system
-        >>>
-        >>> class PipeRequest(BaseModel):  # Input model
-        ...     length: PintGlass("length", "Input")
-        >>> class PipeResponse(BaseModel):  # Output model
-        ...     length: PintGlass("length", "Output")
-        >>>
-        >>> set_unit_system("imperial")
-        >>> req = PipeRequest(length=10)  # 10 ft → stored as 3.048 m
-        >>> print(req.length)
-        3.048
-        >>>
-        >>> resp = PipeResponse(length=3.048)  # 3.048 m → serialized as 10 ft
-        >>> print(resp.model_dump())
-        {'length': 10.0}
-
-    Note:
-        The conversion uses the unit system from context at the time of
-        validation/serialization, making this suitable for per-request
-        unit system handling in async frameworks like FastAPI.
-    """
+        This factory function returns an `Annotated[float, ...]` type that converts
+        between the user's preferred unit system and SI base units.
+
+        Conversion direction depends on model_type:
+        - "Input": Converts from preferred unit system → SI base units
+          (for request models)
+        - "Output": SI base units → preferred unit system (for response models)
+
+        Args:
+            dimension: Physical dimension key (e.g., "pressure", "length")
+            model_type: The model type - "Input" or "Output".
+                - "Input": User sends preferred units, stored as SI
+                - "Output": Stored as SI, serialized to preferred units
+
+        Returns:
+            An Annotated type suitable for use as a Pydantic field type.
+
+        Raises:
+            UnsupportedDimensionError: If the dimension is not supported.
+
+        Example:
+            >>> from pydantic import BaseModel
+            >>> from pint_glass import PintGlass, set_unit_system
+            >>>
+            >>> class PipeRequest(BaseModel):  # Input model
+            ...     length: PintGlass("length", "Input")
+            >>> class PipeResponse(BaseModel):  # Output model
+            ...     length: PintGlass("length", "Output")
+            >>>
+            >>> set_unit_system("imperial")
+            >>> req = PipeRequest(length=10)  # 10 ft → stored as 3.048 m
+            >>> print(req.length)
+            3.048
+            >>>
+            >>> resp = PipeResponse(length=3.048)  # 3.048 m → serialized as 10 ft
+            >>> print(resp.model_dump())
+            {'length': 10.0}
+
+        Note:
+            The conversion uses the unit system from context at the time of
+            validation/serialization, making this suitable for per-request
+            unit system handling in async frameworks like FastAPI.
+        """
+        # Unsupported dimensions fail here, when the model class is defined,
+        # rather than on every validation. The types are keyed by the
+        # normalized dimension, so every spelling of a dimension ("Mass Flow
+        # Rate", "mass_flow_rate") shares one cached type.
+        dimension = _resolve_key(dimension, BASE_SYSTEM)[0]
         if model_type == "Input":
             return _create_input_type(dimension)
         else:
             return _create_output_type(dimension)
 
 
+def _load_row(
+    row: dict[str, tuple[float, float]],
+    table: dict[tuple[str, str], tuple[float, float]],
+    dimension: str,
+) -> None:
+    """Fill ``row`` with one dimension's {system: (scale, offset)} factors.
+
+    The core factor tables are only built on the first conversion, so rows
+    are loaded after a closure's first slow-path conversion rather than when
+    the type is created (which would import pint at model definition time).
+    """
+    if not row:
+        row.update({sys_: f for (dim, sys_), f in table.items() if dim == dimension})
+
+
+# Cached so that every field declaring the same dimension shares one
+# Annotated type (and one pair of closures) instead of building its own.
+@cache
 def _create_input_type(dimension: str) -> Any:
     """Create Input type: preferred → SI (validation), SI → preferred (dump)."""
+    # Bound once here so the closures below read cell variables instead of
+    # looking up module globals on every field; unit_context.get also skips
+    # the get_unit_system() wrapper call.
+    get_system = unit_context.get
+    to_base = convert_to_base
+    from_base = convert_from_base
+    # This dimension's factors keyed by system alone, so a conversion is one
+    # str-keyed dict lookup and a multiply-add. On a miss (row not loaded yet,
+    # or a non-canonical system spelling) the convert_* functions handle it.
+    to_base_row: dict[str, tuple[float, float]] = {}
+    from_base_row: dict[str, tuple[float, float]] = {}
+    # Values are stored in the base system, so base-system requests need no
+    # conversion
+    passthrough = BASE_SYSTEM
 
     def validate_to_base(value: Any) -> float:
         """BeforeValidator: Convert preferred units to base (SI) units."""
-        system = get_unit_system()
+        system = get_system()
 
-        if not isinstance(value, (int, float)):
+        # Floats (the common JSON case) pass through; everything else is
+        # coerced exactly once
+        if type(value) is float:
+            number: float = value
+        else:
             try:
-                value = float(value)
+                number = float(value)
             except (TypeError, ValueError) as e:
                 raise ValueError(f"Cannot convert {value!r} to a numeric value") from e
 
+        if system == passthrough:
+            return number
+        factors = to_base_row.get(system)
+        if factors is not None:
+            scale, offset = factors
+            return scale * number + offset
         try:
-            return convert_to_base(float(value), dimension, system)
-        except (UnsupportedDimensionError, UnitConversionError) as e:
+            result = to_base(number, dimension, system)
+        except PintGlassError as e:
             raise ValueError(str(e)) from e
+        _load_row(to_base_row, _FACTORS_TO_BASE, dimension)
+        return result
 
     def serialize_from_base(value: float) -> float:
         """PlainSerializer: Convert internal base (SI) units back to preferred units."""
-        system = get_unit_system()
+        system = get_system()
+        if system == passthrough:
+            return value
+        factors = from_base_row.get(system)
+        if factors is not None:
+            scale, offset = factors
+            return scale * value + offset
         try:
-            return convert_from_base(value, dimension, system)
-        except (UnsupportedDimensionError, UnitConversionError) as e:
+            result = from_base(value, dimension, system)
+        except PintGlassError as e:
             # Serializers shouldn't typically fail if validation passed, but we handle it
             raise ValueError(str(e)) from e
+        _load_row(from_base_row, _FACTORS_FROM_BASE, dimension)
+        return result
 
     return Annotated[
         float,
@@ -105,26 +174,38 @@ def _create_input_type(dimension: str) -> Any:
     ]
 
 
+@cache
 def _create_output_type(dimension: str) -> Any:
     """Create Output type: SI passthrough (valid), SI → preferred (dump)."""
+    get_system = unit_context.get
+    from_base = convert_from_base
+    from_base_row: dict[str, tuple[float, float]] = {}
+    passthrough = BASE_SYSTEM
 
     def validate_passthrough(value: Any) -> float:
         """BeforeValidator: Accept SI value directly (no conversion on input)."""
-        if not isinstance(value, (int, float)):
-            try:
-                value = float(value)
-            except (TypeError, ValueError) as e:
-                raise ValueError(f"Cannot convert {value!r} to a numeric value") from e
-
-        return float(value)
+        if type(value) is float:
+            return value
+        try:
+            return float(value)
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"Cannot convert {value!r} to a numeric value") from e
 
     def serialize_to_preferred(value: float) -> float:
         """PlainSerializer: Convert SI base units to preferred units for output."""
-        system = get_unit_system()
+        system = get_system()
+        if system == passthrough:
+            return value
+        factors = from_base_row.get(system)
+        if factors is not None:
+            scale, offset = factors
+            return scale * value + offset
         try:
-            return convert_from_base(value, dimension, system)
-        except (UnsupportedDimensionError, UnitConversionError) as e:
+            result = from_base(value, dimension, system)
+        except PintGlassError as e:
             raise ValueError(str(e)) from e
+        _load_row(from_base_row, _FACTORS_FROM_BASE, dimension)
+        return result
 
     return Annotated[
         float,
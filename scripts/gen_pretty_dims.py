@@ -0,0 +1,63 @@
+"""Regenerate the pretty TARGET_DIMENSIONS literal in pint_glass/dimensions.py.
+
+TARGET_DIMENSIONS is built from a plain dict literal so that importing
+pint_glass.dimensions never has to build a pint UnitRegistry. Run this script
+after editing _TARGET_DIMENSIONS_RAW to rewrite the generated block:
+
+    python scripts/gen_pretty_dims.py
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import json
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+DIMENSIONS_PY = ROOT / "pint_glass" / "dimensions.py"
+
+BEGIN = "# BEGIN GENERATED by scripts/gen_pretty_dims.py - do not edit by hand\n"
+END = "# END GENERATED\n"
+
+
+def _quote(text: str) -> str:
+    """Quote a string as a double-quoted Python literal, keeping unicode as-is."""
+    return json.dumps(text, ensure_ascii=False)
+
+
+def render() -> str:
+    """Render the _PRETTY_DIMENSIONS assignment as Python source."""
+    # Load dimensions.py on its own rather than through the package, so a
+    # missing or stale generated block cannot break the import.
+    spec = importlib.util.spec_from_file_location("_dimensions", DIMENSIONS_PY)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    lines = ["_PRETTY_DIMENSIONS: dict[str, dict[str, str]] = {"]
+    for dim, unit_map in module.get_pretty_dimensions().items():
+        lines.append(f"    {_quote(dim)}: {{")
+        lines.extend(
+            f"        {_quote(system)}: {_quote(unit)},"
+            for system, unit in unit_map.items()
+        )
+        lines.append("    },")
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+def main() -> None:
+    """Rewrite the generated block of dimensions.py in place."""
+    source = DIMENSIONS_PY.read_text(encoding="utf-8")
+    head, found_begin, rest = source.partition(BEGIN)
+    _, found_end, tail = rest.partition(END)
+    if not (found_begin and found_end):
+        sys.exit(f"Generated block markers not found in {DIMENSIONS_PY}")
+
+    DIMENSIONS_PY.write_text(head + BEGIN + render() + END + tail, encoding="utf-8")
+    print(f"Updated {DIMENSIONS_PY.relative_to(ROOT)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,24 +4,58 @@ FastAPI server demonstrating real-world usage of PintGlass with
 Pump and Line engineering models.
 """
 
-from fastapi import FastAPI, Request
+import logging
+import os
+from contextvars import ContextVar
+from typing import Any, get_args
+
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from fastapi.responses import JSONResponse, ORJSONResponse
+from pydantic import BaseModel, ConfigDict
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from pint_glass import (
+    DEFAULT_SYSTEM,
     TARGET_DIMENSIONS,
+    UNIT_SYSTEMS,
     PintGlass,
+    convert_from_base,
+    get_unit_system,
     reset_unit_system,
     set_unit_system,
 )
 
+# orjson comes with the "demo" extra; fall back to the stdlib encoder (and
+# JSONResponse) so the demo also runs with a plain `uv run`
+try:
+    from orjson import dumps as json_dumps
+except ImportError:
+    import json
+
+    def json_dumps(obj: Any) -> bytes:  # type: ignore[misc]
+        """Encode ``obj`` as UTF-8 JSON bytes, like ``orjson.dumps``."""
+        return json.dumps(obj).encode()
+
+    DefaultResponse: type[JSONResponse] = JSONResponse
+else:
+    DefaultResponse = ORJSONResponse
+
+
 # =============================================================================
 # Models - Real-world engineering examples
 # =============================================================================
 
 
 class PumpInput(BaseModel):
-    """Pump specification input from user (preferred units)."""
+    """Pump specification in preferred units, held internally as SI.
+
+    Responses convert the SI values back to preferred units with
+    to_preferred(), so there is no separate output model to validate.
+    """
+
+    # Request bodies are read-only and carry exactly these fields
+    model_config = ConfigDict(frozen=True, extra="forbid")
 
     flow_rate: PintGlass("volumetric_flow_rate", "Input")
     head_pressure: PintGlass("pressure", "Input")
@@ -30,18 +64,13 @@ class PumpInput(BaseModel):
     pipe_diameter: PintGlass("length", "Input")
 
 
-class PumpOutput(BaseModel):
-    """Pump specification output (converted back to preferred units)."""
-
-    flow_rate: PintGlass("volumetric_flow_rate", "Output")
-    head_pressure: PintGlass("pressure", "Output")
-    power: PintGlass("power", "Output")
-    inlet_temperature: PintGlass("temperature", "Output")
-    pipe_diameter: PintGlass("length", "Output")
+class LineInput(BaseModel):
+    """Pipeline specification in preferred units, held internally as SI.
 
+    Converted back for the response with to_preferred(), like PumpInput.
+    """
 
-class LineInput(BaseModel):
-    """Pipeline specification input from user (preferred units)."""
+    model_config = ConfigDict(frozen=True, extra="forbid")
 
     length: PintGlass("length", "Input")
     velocity: PintGlass("velocity", "Input")
@@ -50,58 +79,178 @@ class LineInput(BaseModel):
     viscosity: PintGlass("viscosity", "Input")
 
 
-class LineOutput(BaseModel):
-    """Pipeline specification output (converted back to preferred units)."""
+# PintGlass builds one type per dimension, so a field's validator identifies
+# the dimension it was declared with. Maps to the canonical snake_case name,
+# which convert_from_base looks up fastest, and the SI unit label.
+_VALIDATOR_DIMENSIONS = {
+    get_args(PintGlass(name, "Input"))[1]: (
+        name.lower().replace(" ", "_"),
+        units["si"],
+    )
+    for name, units in TARGET_DIMENSIONS.items()
+}
 
-    length: PintGlass("length", "Output")
-    velocity: PintGlass("velocity", "Output")
-    pressure_drop: PintGlass("pressure", "Output")
-    fluid_density: PintGlass("density", "Output")
-    viscosity: PintGlass("viscosity", "Output")
+
+def field_table(model: type[BaseModel]) -> tuple[tuple[str, str, str], ...]:
+    """Read (field, dimension, SI unit label) from a model's PintGlass fields.
+
+    Derived from the field annotations, so the tables cannot disagree with
+    the dimensions the models actually declare.
+    """
+    return tuple(
+        (field, *_VALIDATOR_DIMENSIONS[info.metadata[0]])
+        for field, info in model.model_fields.items()
+    )
+
+
+# Used to build responses and log lines directly. Tuples: these are only ever
+# iterated in order.
+PUMP_FIELDS = field_table(PumpInput)
+LINE_FIELDS = field_table(LineInput)
+
+
+def to_preferred(
+    model: BaseModel, fields: tuple[tuple[str, str, str], ...]
+) -> dict[str, float]:
+    """Convert a model's SI values to the request's preferred units.
+
+    Equivalent to ``model.model_dump()`` for PintGlass "Input" fields, but a
+    plain dict comprehension instead of a full Pydantic serialization pass.
+    """
+    system = get_unit_system()
+    return {
+        field: convert_from_base(getattr(model, field), dimension, system)
+        for field, dimension, _ in fields
+    }
+
+
+def si_value_lines(
+    model: BaseModel, fields: tuple[tuple[str, str, str], ...]
+) -> list[str]:
+    """Format a model's internal SI values as console log lines."""
+    return [f"    {field}: {getattr(model, field)} {unit}" for field, _, unit in fields]
 
 
 # =============================================================================
 # Application Setup
 # =============================================================================
 
-app = FastAPI(title="PintGlass Demo API", version="1.0.0")
+# Responses are small dicts of floats, which orjson encodes far faster than
+# the stdlib json encoder (install with the "demo" extra, otherwise the plain
+# JSONResponse is used)
+#
+# Recent FastAPI releases deprecate ORJSONResponse in favour of Pydantic
+# serialization, which needs a response model or return type per route. The
+# endpoints here return plain dicts, so the FastAPIDeprecationWarning is
+# accepted knowingly; FastAPI is deliberately not pinned below that release.
+app = FastAPI(
+    title="PintGlass Demo API",
+    version="1.0.0",
+    default_response_class=DefaultResponse,
+)
+
+
+class OriginGatedCORSMiddleware:
+    """Run CORSMiddleware only for requests that carry an Origin header.
+
+    Server-to-server calls (scripts, other services) never send Origin, so
+    they go straight to the app without passing through the CORS layer.
+    """
+
+    def __init__(self, app: ASGIApp, **cors_options: Any) -> None:
+        self.app = app
+        self.cors = CORSMiddleware(app, **cors_options)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Send requests with an Origin header through CORS, the rest straight on."""
+        if scope["type"] == "http":
+            for name, _ in scope["headers"]:
+                if name == b"origin":
+                    await self.cors(scope, receive, send)
+                    return
+        await self.app(scope, receive, send)
+
+
+# The defaults cover serving index.html from a local dev server. Override with
+# a comma-separated CORS_ORIGINS. "null" (index.html opened straight from disk)
+# is opt-in only, since sandboxed iframes and data: URLs send it too. Explicit
+# lists let the CORS middleware answer with simple set lookups instead of
+# wildcard handling.
+CORS_ORIGINS = os.getenv(
+    "CORS_ORIGINS",
+    "http://localhost:5173,http://localhost:8000,http://127.0.0.1:8000",
+).split(",")
 
 app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    OriginGatedCORSMiddleware,
+    allow_origins=CORS_ORIGINS,
+    allow_methods=("GET", "POST"),
+    allow_headers=("Content-Type", "X-Unit-System"),
 )
 
-# Store for console logs (per-request)
-console_logs: list[str] = []
+logger = logging.getLogger(__name__)
+
+# Console logs are collected (and returned to the frontend) only when the
+# server runs with PINTGLASS_DEBUG=1; otherwise log() does nothing.
+DEBUG = os.getenv("PINTGLASS_DEBUG") == "1"
+
+# Console logs for the current request. A context variable rather than a
+# module global, so concurrent requests each get their own list.
+console_logs: ContextVar[list[str]] = ContextVar("console_logs")
+
 
+def log(*messages: str) -> None:
+    """Log messages to the request's console buffer and the module logger.
 
-def log(message: str) -> None:
-    """Log message to console buffer and stdout."""
-    console_logs.append(message)
-    print(message)
+    Several lines can be passed at once; they are appended together and
+    emitted as a single log record.
+    """
+    if DEBUG:
+        console_logs.get().extend(messages)
+        logger.debug("\n".join(messages))
 
 
-@app.middleware("http")
-async def unit_system_middleware(request: Request, call_next):
-    """Set unit system context from X-Unit-System header."""
-    global console_logs
-    console_logs = []  # Clear logs for new request
+class UnitSystemMiddleware:
+    """Pure ASGI middleware setting the unit system from the X-Unit-System header.
 
-    system = request.headers.get("X-Unit-System", "imperial").lower()
-    log(f"[Middleware] Received X-Unit-System header: '{system}'")
+    Reads the header straight from the ASGI scope instead of wrapping the app
+    in ``BaseHTTPMiddleware``, which builds a Request, a streaming response
+    wrapper and a task group for every request.
+    """
 
-    token = set_unit_system(system)
-    log(f"[Middleware] Unit system context set to: '{system}'")
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
 
-    try:
-        response = await call_next(request)
-        return response
-    finally:
-        reset_unit_system(token)
-        log("[Middleware] Unit system context reset")
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Run the app inside the unit system named by the request's header."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        logs_token = console_logs.set([]) if DEBUG else None
+
+        system = "imperial"
+        for name, value in scope["headers"]:
+            if name == b"x-unit-system":
+                system = value.decode("latin-1").lower()
+                break
+        if system not in UNIT_SYSTEMS:
+            system = DEFAULT_SYSTEM
+
+        # The context already defaults to DEFAULT_SYSTEM, so only other
+        # systems need to be set (and reset afterwards)
+        token = None if system == DEFAULT_SYSTEM else set_unit_system(system)
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            if token is not None:
+                reset_unit_system(token)
+            if logs_token is not None:
+                console_logs.reset(logs_token)
+
+
+app.add_middleware(UnitSystemMiddleware)
 
 
 # =============================================================================
@@ -115,74 +264,58 @@ async def health():
     return {"status": "ok"}
 
 
+# TARGET_DIMENSIONS never changes, so the response body is encoded once at
+# startup and sent as-is, skipping per-request serialization entirely
+DIMENSIONS_JSON = json_dumps(
+    {
+        "dimensions": list(TARGET_DIMENSIONS.keys()),
+        "mappings": {dim: dict(units) for dim, units in TARGET_DIMENSIONS.items()},
+    }
+)
+
+
 @app.get("/dimensions")
 async def get_dimensions():
     """Return all supported dimensions with their unit mappings."""
-    return {
-        "dimensions": list(TARGET_DIMENSIONS.keys()),
-        "mappings": TARGET_DIMENSIONS,
-    }
+    return Response(content=DIMENSIONS_JSON, media_type="application/json")
 
 
 @app.post("/pump")
 async def process_pump(pump: PumpInput):
     """Process pump data - demonstrates round-trip conversion."""
-    log("\n[Endpoint: /pump] Received PumpInput")
-    log("  Raw input values (already converted to SI internally):")
-    log(f"    flow_rate: {pump.flow_rate} m³/s")
-    log(f"    head_pressure: {pump.head_pressure} Pa")
-    log(f"    power: {pump.power} W")
-    log(f"    inlet_temperature: {pump.inlet_temperature} °C")
-    log(f"    pipe_diameter: {pump.pipe_diameter} m")
-
-    # Business logic would go here (always works in SI)
-    log("\n[Processing] Business logic executes with SI values...")
-
-    # Create output - will be serialized back to preferred units
-    output = PumpOutput(
-        flow_rate=pump.flow_rate,
-        head_pressure=pump.head_pressure,
-        power=pump.power,
-        inlet_temperature=pump.inlet_temperature,
-        pipe_diameter=pump.pipe_diameter,
-    )
-
-    log("\n[Response] PumpOutput created (will serialize to preferred units)")
+    # Checked here too so the f-strings are not even built when not debugging
+    if DEBUG:
+        log(
+            "\n[Endpoint: /pump] Received PumpInput",
+            "  Raw input values (already converted to SI internally):",
+            *si_value_lines(pump, PUMP_FIELDS),
+            # Business logic would go here (always works in SI)
+            "\n[Processing] Business logic executes with SI values...",
+            "\n[Response] Returning pump data converted to preferred units",
+        )
 
     return {
-        "data": output,
-        "console": console_logs.copy(),
+        "data": to_preferred(pump, PUMP_FIELDS),
+        "console": console_logs.get([]),
     }
 
 
 @app.post("/line")
 async def process_line(line: LineInput):
     """Process line/pipeline data - demonstrates round-trip conversion."""
-    log("\n[Endpoint: /line] Received LineInput")
-    log("  Raw input values (already converted to SI internally):")
-    log(f"    length: {line.length} m")
-    log(f"    velocity: {line.velocity} m/s")
-    log(f"    pressure_drop: {line.pressure_drop} Pa")
-    log(f"    fluid_density: {line.fluid_density} kg/m³")
-    log(f"    viscosity: {line.viscosity} Pa·s")
-
-    # Business logic would go here (always works in SI)
-    log("\n[Processing] Business logic executes with SI values...")
-
-    # Create output
-    output = LineOutput(
-        length=line.length,
-        velocity=line.velocity,
-        pressure_drop=line.pressure_drop,
-        fluid_density=line.fluid_density,
-        viscosity=line.viscosity,
-    )
-
-    log("\n[Response] LineOutput created (will serialize to preferred units)")
+    if DEBUG:
+        log(
+            "\n[Endpoint: /line] Received LineInput",
+            "  Raw input values (already converted to SI internally):",
+            *si_value_lines(line, LINE_FIELDS),
+            # Business logic would go here (always works in SI)
+            "\n[Processing] Business logic executes with SI values...",
+            "\n[Response] Returning line data converted to preferred units",
+        )
 
     return {
-        "data": output,
-        "console": console_logs.copy(),
+        "data": to_preferred(line, LINE_FIELDS),
+        "console": console_logs.get([]),
     }
 
 
@@ -193,6 +326,23 @@ async def process_line(line: LineInput):
 if __name__ == "__main__":
     import uvicorn
 
+    # Set PINTGLASS_DEBUG=1 to collect per-request console logs and echo them
+    logging.basicConfig(
+        level=logging.DEBUG if DEBUG else logging.INFO, format="%(message)s"
+    )
     print("Starting PintGlass Demo API on http://localhost:8001")
     print("Open index.html in browser to test the frontend")
-    uvicorn.run(app, host="0.0.0.0", port=8001)
+    if not DEBUG:
+        print("Set PINTGLASS_DEBUG=1 to show backend console logs in the frontend")
+    # "auto" picks uvloop and httptools when they are installed (the "demo"
+    # extra; uvloop is not available on Windows) and falls back to asyncio and
+    # h11 otherwise. For production, set WEB_CONCURRENCY to the number of CPU
+    # cores to run one worker per core.
+    uvicorn.run(
+        "fast_api_check:app",
+        host="0.0.0.0",
+        port=8001,
+        loop="auto",
+        http="auto",
+        workers=int(os.getenv("WEB_CONCURRENCY", "1")),
+    )
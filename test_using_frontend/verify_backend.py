@@ -1,54 +1,162 @@
 """Verification script for PintGlass Demo Backend.
 
 Tests the /pump and /line endpoints with different unit systems.
-"""
-
-import json
-import urllib.request
 
+The endpoint checks run concurrently once the health check has passed, each
+request on its own short-lived connection. Each check returns its report
+lines, which are printed in order at the end.
+"""
 
-def test_endpoint(url: str, data: dict, unit_system: str = "imperial") -> dict | None:
-    """Send POST request and return response."""
+import http.client
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from typing import Any, NamedTuple
+
+# orjson comes with the "demo" extra, like the backend itself; fall back to
+# the stdlib encoder so the script also runs without it
+try:
+    from orjson import dumps as json_dumps
+    from orjson import loads as json_loads
+except ImportError:
+    import json
+
+    def json_dumps(obj: Any) -> bytes:  # type: ignore[misc]
+        """Encode ``obj`` as UTF-8 JSON bytes, like ``orjson.dumps``."""
+        return json.dumps(obj).encode()
+
+    json_loads = json.loads  # type: ignore[assignment]
+
+HOST = "localhost"
+PORT = 8001
+
+
+def request_json(
+    method: str,
+    path: str,
+    body: bytes | None = None,
+    headers: dict[str, str] | None = None,
+) -> dict:
+    """Send a request on a new connection and decode the JSON response.
+
+    The request is never retried: a dropped connection does not show that
+    the backend skipped it, and the checks POST their payloads.
+
+    Raises:
+        RuntimeError: If the backend answers with an error status.
+        OSError: If the backend cannot be reached.
+    """
+    with closing(http.client.HTTPConnection(HOST, PORT, timeout=10)) as conn:
+        conn.request(method, path, body=body, headers=headers or {})
+        response = conn.getresponse()
+        payload = response.read()
+    if response.status >= http.client.BAD_REQUEST:
+        raise RuntimeError(payload.decode())
+    return json_loads(payload)
+
+
+def test_endpoint(
+    path: str, data: dict, unit_system: str = "imperial"
+) -> tuple[dict | None, str | None]:
+    """Send POST request and return the response, or None and an error."""
     headers = {
         "Content-Type": "application/json",
         "X-Unit-System": unit_system,
     }
 
-    req = urllib.request.Request(
-        url,
-        data=json.dumps(data).encode("utf-8"),
-        headers=headers,
-        method="POST",
-    )
+    body = json_dumps(data)
+    try:
+        return request_json("POST", path, body, headers), None
+    except (RuntimeError, OSError) as e:
+        return None, f"  ERROR: {e}"
+
+
+PUMP_DATA = {
+    "flow_rate": 100,
+    "head_pressure": 50,
+    "power": 10,
+    "inlet_temperature": 68,
+    "pipe_diameter": 4,
+}
+
+LINE_DATA = {
+    "length": 1000,
+    "velocity": 10,
+    "pressure_drop": 15,
+    "fluid_density": 62.4,
+    "viscosity": 0.001,
+}
+
+
+class RoundTrip(NamedTuple):
+    """An endpoint check: ``field`` should come back as it was sent."""
+
+    title: str
+    path: str
+    data: dict
+    unit_system: str
+    field: str
+    unit: str
+
+
+ROUND_TRIP_CHECKS = [
+    RoundTrip("[Test 2] Pump Endpoint - Imperial", "/pump", PUMP_DATA, "imperial",
+              "flow_rate", "ft³/s"),
+    RoundTrip("[Test 3] Pump Endpoint - SI", "/pump", PUMP_DATA, "si",
+              "flow_rate", "m³/s"),
+    RoundTrip("[Test 4] Line Endpoint - Imperial", "/line", LINE_DATA, "imperial",
+              "length", "ft"),
+    RoundTrip("[Test 5] Line Endpoint - SI", "/line", LINE_DATA, "si",
+              "length", "m"),
+]  # fmt: skip
+
+
+def check_round_trip(check: RoundTrip) -> list[str]:
+    """Check that a field comes back in the units it was sent in."""
+    lines = [f"\n{check.title}"]
+    result, error = test_endpoint(check.path, check.data, check.unit_system)
+    if error:
+        lines.append(error)
+    expected = check.data[check.field]
+    if result and abs(result["data"][check.field] - expected) < 0.001:
+        lines.append("  ✅ PASS - Round-trip conversion correct")
+        lines.append(
+            f"     Input: {expected} {check.unit} → "
+            f"Output: {result['data'][check.field]:.4f} {check.unit}"
+        )
+    else:
+        lines.append("  ❌ FAIL")
+    return lines
 
+
+def check_dimensions() -> list[str]:
+    """Check that the dimensions endpoint lists the supported dimensions."""
+    lines = ["\n[Test 6] Dimensions Endpoint"]
     try:
-        with urllib.request.urlopen(req) as response:
-            return json.load(response)
-    except urllib.error.HTTPError as e:
-        print(f"  ERROR: {e.read().decode()}")
-        return None
-    except urllib.error.URLError as e:
-        print(f"  ERROR: {e.reason}")
-        return None
+        dims = request_json("GET", "/dimensions")
+        if "dimensions" in dims and len(dims["dimensions"]) > 0:
+            lines.append(f"  ✅ PASS - {len(dims['dimensions'])} dimensions available")
+            lines.append(f"     Sample: {dims['dimensions'][:5]}...")
+        else:
+            lines.append("  ❌ FAIL")
+    except Exception as e:
+        lines.append(f"  ❌ FAIL - {e}")
+    return lines
 
 
 def run_tests():
     """Run all verification tests."""
-    base_url = "http://localhost:8001"
-
     print("=" * 60)
     print("PintGlass Demo Backend Verification")
     print("=" * 60)
 
-    # Test 1: Health check
+    # Test 1: Health check (run first: the rest is pointless without a backend)
     print("\n[Test 1] Health Check")
     try:
-        with urllib.request.urlopen(f"{base_url}/health") as resp:
-            health = json.load(resp)
-            if health.get("status") == "ok":
-                print("  ✅ PASS - Backend is running")
-            else:
-                print("  ❌ FAIL - Unexpected response")
+        health = request_json("GET", "/health")
+        if health.get("status") == "ok":
+            print("  ✅ PASS - Backend is running")
+        else:
+            print("  ❌ FAIL - Unexpected response")
     except Exception as e:
         print(f"  ❌ FAIL - {e}")
         print(
@@ -56,70 +164,12 @@ def run_tests():
         )
         return
 
-    # Test 2: Pump endpoint with Imperial
-    print("\n[Test 2] Pump Endpoint - Imperial")
-    pump_data = {
-        "flow_rate": 100,
-        "head_pressure": 50,
-        "power": 10,
-        "inlet_temperature": 68,
-        "pipe_diameter": 4,
-    }
-    result = test_endpoint(f"{base_url}/pump", pump_data, "imperial")
-    if result and abs(result["data"]["flow_rate"] - 100) < 0.001:
-        print("  ✅ PASS - Round-trip conversion correct")
-        print(
-            f"     Input: 100 ft³/s → Output: {result['data']['flow_rate']:.4f} ft³/s"
-        )
-    else:
-        print("  ❌ FAIL")
-
-    # Test 3: Pump endpoint with SI
-    print("\n[Test 3] Pump Endpoint - SI")
-    result = test_endpoint(f"{base_url}/pump", pump_data, "si")
-    if result and abs(result["data"]["flow_rate"] - 100) < 0.001:
-        print("  ✅ PASS - Round-trip conversion correct")
-        print(f"     Input: 100 m³/s → Output: {result['data']['flow_rate']:.4f} m³/s")
-    else:
-        print("  ❌ FAIL")
-
-    # Test 4: Line endpoint with Imperial
-    print("\n[Test 4] Line Endpoint - Imperial")
-    line_data = {
-        "length": 1000,
-        "velocity": 10,
-        "pressure_drop": 15,
-        "fluid_density": 62.4,
-        "viscosity": 0.001,
-    }
-    result = test_endpoint(f"{base_url}/line", line_data, "imperial")
-    if result and abs(result["data"]["length"] - 1000) < 0.001:
-        print("  ✅ PASS - Round-trip conversion correct")
-        print(f"     Input: 1000 ft → Output: {result['data']['length']:.4f} ft")
-    else:
-        print("  ❌ FAIL")
-
-    # Test 5: Line endpoint with SI
-    print("\n[Test 5] Line Endpoint - SI")
-    result = test_endpoint(f"{base_url}/line", line_data, "si")
-    if result and abs(result["data"]["length"] - 1000) < 0.001:
-        print("  ✅ PASS - Round-trip conversion correct")
-        print(f"     Input: 1000 m → Output: {result['data']['length']:.4f} m")
-    else:
-        print("  ❌ FAIL")
-
-    # Test 6: Dimensions endpoint
-    print("\n[Test 6] Dimensions Endpoint")
-    try:
-        with urllib.request.urlopen(f"{base_url}/dimensions") as resp:
-            dims = json.load(resp)
-            if "dimensions" in dims and len(dims["dimensions"]) > 0:
-                print(f"  ✅ PASS - {len(dims['dimensions'])} dimensions available")
-                print(f"     Sample: {dims['dimensions'][:5]}...")
-            else:
-                print("  ❌ FAIL")
-    except Exception as e:
-        print(f"  ❌ FAIL - {e}")
+    # Tests 2-6 are independent, so they run concurrently, one thread each
+    with ThreadPoolExecutor(max_workers=len(ROUND_TRIP_CHECKS) + 1) as pool:
+        futures = [pool.submit(check_round_trip, c) for c in ROUND_TRIP_CHECKS]
+        futures.append(pool.submit(check_dimensions))
+        for future in futures:
+            print("\n".join(future.result()))
 
     print("\n" + "=" * 60)
     print("Verification complete!")
@@ -1,8 +1,24 @@
 """Pytest configuration and fixtures for PintGlass tests."""
 
 import pytest
+from pydantic import BaseModel
 
-from pint_glass import set_unit_system, unit_context
+from pint_glass import PintGlass, set_unit_system, unit_context
+from pint_glass.context import _suggest, _warned_systems
+
+
+@pytest.fixture(autouse=True)
+def reset_unknown_system_warnings():
+    """Forget which unknown unit systems were warned about, for every test.
+
+    set_unit_system warns once per unknown system per process, so without
+    this a test's "warns" assertions would depend on which tests ran before.
+    """
+    _warned_systems.clear()
+    _suggest.cache_clear()
+    yield
+    _warned_systems.clear()
+    _suggest.cache_clear()
 
 
 @pytest.fixture
@@ -21,6 +37,26 @@ def si_context():
     unit_context.reset(token)
 
 
+@pytest.fixture(scope="session")
+def pressure_input_model() -> type[BaseModel]:
+    """Model with a single pressure Input field, built once per session."""
+
+    class PressureInput(BaseModel):
+        pressure: PintGlass("pressure", "Input")
+
+    return PressureInput
+
+
+@pytest.fixture(scope="session")
+def pressure_output_model() -> type[BaseModel]:
+    """Model with a single pressure Output field, built once per session."""
+
+    class PressureOutput(BaseModel):
+        pressure: PintGlass("pressure", "Output")
+
+    return PressureOutput
+
+
 @pytest.fixture
 def reset_context():
     """Fixture that resets context after each test."""
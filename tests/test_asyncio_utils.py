@@ -0,0 +1,88 @@
+"""Tests for pint_glass.asyncio_utils module."""
+
+import asyncio
+
+import pytest
+from pydantic import BaseModel
+
+from pint_glass import (
+    PintGlass,
+    get_unit_system,
+    reset_unit_system,
+    run_in_system,
+    set_unit_system,
+    spawn_request,
+)
+from pint_glass.dimensions import DEFAULT_SYSTEM
+
+
+class PipeData(BaseModel):
+    """Model used to check conversions inside run_in_system."""
+
+    length: PintGlass("length", "Input")
+
+
+async def current_system() -> str:
+    """Return the unit system seen inside the task."""
+    await asyncio.sleep(0)
+    return get_unit_system()
+
+
+async def pipe_length(value: float) -> float:
+    """Validate a length inside the task and return it in SI."""
+    await asyncio.sleep(0)
+    return PipeData(length=value).length
+
+
+class TestRunInSystem:
+    """Tests for run_in_system."""
+
+    @pytest.mark.asyncio
+    async def test_sets_system_for_coroutine(self) -> None:
+        """The coroutine should see the requested unit system."""
+        assert await run_in_system("imperial", current_system()) == "imperial"
+
+    @pytest.mark.asyncio
+    async def test_does_not_leak_into_caller(self) -> None:
+        """The caller's unit system should be unchanged afterwards."""
+        await run_in_system("si", current_system())
+        assert get_unit_system() == DEFAULT_SYSTEM
+
+    @pytest.mark.asyncio
+    async def test_normalizes_system(self) -> None:
+        """System names go through set_unit_system normalization."""
+        assert await run_in_system("IMPERIAL", current_system()) == "imperial"
+
+    @pytest.mark.asyncio
+    async def test_concurrent_systems_in_task_group(self) -> None:
+        """Concurrent tasks with different systems should convert independently."""
+        async with asyncio.TaskGroup() as tg:
+            imperial = [
+                tg.create_task(run_in_system("imperial", pipe_length(10)))
+                for _ in range(20)
+            ]
+            si = [
+                tg.create_task(run_in_system("si", pipe_length(10))) for _ in range(20)
+            ]
+
+        assert all(abs(t.result() - 3.048) < 0.001 for t in imperial)
+        assert all(t.result() == 10.0 for t in si)
+
+
+class TestSpawnRequest:
+    """Tests for spawn_request."""
+
+    @pytest.mark.asyncio
+    async def test_starts_from_default_system(self) -> None:
+        """The task should not inherit the caller's unit system."""
+        token = set_unit_system("imperial")
+        try:
+            assert await spawn_request(current_system()) == DEFAULT_SYSTEM
+        finally:
+            reset_unit_system(token)
+
+    @pytest.mark.asyncio
+    async def test_sets_given_system(self) -> None:
+        """The task should run under the given unit system."""
+        assert await spawn_request(pipe_length(10), "imperial") == pytest.approx(3.048)
+        assert get_unit_system() == DEFAULT_SYSTEM
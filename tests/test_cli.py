@@ -0,0 +1,48 @@
+"""Tests for pint_glass.cli module."""
+
+import json
+
+import pytest
+
+from pint_glass.cli import main
+
+
+class TestExportCommand:
+    """Tests for the `export` command."""
+
+    def test_prints_json_to_stdout(self, capsys: pytest.CaptureFixture[str]) -> None:
+        """Without --output the configuration should be printed."""
+        main(["export"])
+        config = json.loads(capsys.readouterr().out)
+        assert "systems" in config
+        assert "pressure" in config["dimensions"]
+
+    @pytest.mark.parametrize(
+        "options",
+        [["-o", "{path}"], ["--output", "{path}"], ["--output={path}"], ["-o{path}"]],
+    )
+    def test_writes_output_file(self, tmp_path, options: list[str]) -> None:
+        """All spellings of the output option should write the file."""
+        path = tmp_path / "units.json"
+        main(["export", *(o.format(path=path) for o in options)])
+        assert "dimensions" in json.loads(path.read_text(encoding="utf-8"))
+
+
+class TestUsage:
+    """Tests for help output and argument errors."""
+
+    @pytest.mark.parametrize("argv", [[], ["-h"], ["--help"], ["export", "--help"]])
+    def test_prints_help(self, argv: list[str], capsys) -> None:
+        """No command or a help flag should print usage."""
+        main(argv)
+        assert "usage: pint-glass" in capsys.readouterr().out
+
+    @pytest.mark.parametrize(
+        "argv", [["import"], ["export", "--bogus"], ["export", "-o"]]
+    )
+    def test_invalid_arguments_exit_2(self, argv: list[str], capsys) -> None:
+        """Unknown commands, unknown options and missing values should exit 2."""
+        with pytest.raises(SystemExit) as exc_info:
+            main(argv)
+        assert exc_info.value.code == 2
+        assert "pint-glass: error:" in capsys.readouterr().err
@@ -14,7 +14,7 @@ These tests verify that:
 
 
 
-2. Request-scoped cache is properly isolated between requests
+2. Conversions in concurrent tasks use their own task's unit system
 
 
 
@@ -31,9 +31,8 @@ from pydantic import BaseModel
 from pint_glass import (
     DEFAULT_SYSTEM,
     SUPPORTED_SYSTEMS,
+    UNIT_SYSTEMS,
     PintGlass,
-    clear_request_cache,
-    get_request_cache,
     get_unit_system,
     reset_unit_system,
     set_unit_system,
@@ -58,6 +57,11 @@ class TestSupportedSystems:
 
         assert isinstance(SUPPORTED_SYSTEMS, frozenset)
 
+    def test_supported_systems_is_unit_systems(self) -> None:
+        """SUPPORTED_SYSTEMS should be the very same set as UNIT_SYSTEMS."""
+
+        assert SUPPORTED_SYSTEMS is UNIT_SYSTEMS
+
 
 class TestUnknownSystemWarning:
     """Tests for warning on unknown unit systems."""
@@ -82,128 +86,102 @@ class TestUnknownSystemWarning:
             finally:
                 reset_unit_system(token)
 
-    def test_unknown_system_falls_back_to_default(self) -> None:
-        """Unknown system should fallback to DEFAULT_SYSTEM."""
-
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore")
-
-            token = set_unit_system("bogus")
-
-            try:
-                assert get_unit_system() == DEFAULT_SYSTEM
-
-            finally:
-                reset_unit_system(token)
-
-    def test_valid_system_no_warning(self) -> None:
-        """Valid systems should not emit warnings."""
+    def test_unknown_system_suggests_closest_match(self) -> None:
+        """A typo of a supported system should be suggested in the warning."""
 
         with warnings.catch_warnings(record=True) as w:
             warnings.simplefilter("always")
 
-            token = set_unit_system("si")
+            token = set_unit_system("imperal")
 
             try:
-                assert len(w) == 0
+                assert len(w) == 1
+
+                assert "Did you mean 'imperial'?" in str(w[0].message)
 
             finally:
                 reset_unit_system(token)
 
-    def test_case_insensitive_system(self) -> None:
-        """System names should be case-insensitive."""
+    @pytest.mark.parametrize(
+        ("alias", "expected"),
+        [("english", "imperial"), ("us-customary", "us"), ("oilfield", "engg_field")],
+    )
+    def test_unknown_system_suggests_known_alias(
+        self, alias: str, expected: str
+    ) -> None:
+        """Common names for a supported system should suggest that system."""
 
         with warnings.catch_warnings(record=True) as w:
             warnings.simplefilter("always")
 
-            token = set_unit_system("SI")
+            token = set_unit_system(alias)
 
             try:
-                assert len(w) == 0
+                assert len(w) == 1
 
-                assert get_unit_system() == "si"
+                assert f"Did you mean '{expected}'?" in str(w[0].message)
 
             finally:
                 reset_unit_system(token)
 
+    def test_unknown_system_falls_back_to_default(self) -> None:
+        """Unknown system should fallback to DEFAULT_SYSTEM."""
 
-class TestRequestScopedCache:
-    """Tests for request-scoped conversion cache."""
-
-    def test_cache_starts_empty(self) -> None:
-        """Cache should start empty in new context."""
-
-        _ = clear_request_cache()
-
-        try:
-            cache = get_request_cache()
-
-            assert len(cache) == 0
-
-        finally:
-            # Reset not strictly needed but good practice
-
-            pass
-
-    def test_cache_stores_conversions(self) -> None:
-        """Conversions should be cached."""
-
-        _ = clear_request_cache()
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
 
-        try:
-            token = set_unit_system("imperial")
+            token = set_unit_system("bogus")
 
             try:
-
-                class TestModel(BaseModel):
-                    length: PintGlass("length", "Input")
-
-                # First conversion - cache miss
-
-                _ = TestModel(length=10)
-
-                cache = get_request_cache()
-
-                # Cache should have entries now
-
-                assert len(cache) > 0
+                assert get_unit_system() == DEFAULT_SYSTEM
 
             finally:
                 reset_unit_system(token)
 
-        finally:
-            pass
+    def test_unknown_system_warns_once(self) -> None:
+        """Repeating the same unknown system should only warn the first time."""
 
-    def test_clear_cache_isolates_requests(self) -> None:
-        """Clearing cache should provide isolation."""
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
 
-        # Simulate first request
+            for spelling in ("metric", "METRIC", "metric"):
+                token = set_unit_system(spelling)
+                try:
+                    assert get_unit_system() == DEFAULT_SYSTEM
+                finally:
+                    reset_unit_system(token)
 
-        _ = clear_request_cache()
+            assert len(w) == 1
 
-        token1 = set_unit_system("imperial")
+    def test_valid_system_no_warning(self) -> None:
+        """Valid systems should not emit warnings."""
 
-        try:
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
 
-            class Model1(BaseModel):
-                pressure: PintGlass("pressure", "Input")
+            token = set_unit_system("si")
 
-            _ = Model1(pressure=100)
+            try:
+                assert len(w) == 0
 
-            cache1_size = len(get_request_cache())
+            finally:
+                reset_unit_system(token)
 
-            assert cache1_size > 0
+    def test_case_insensitive_system(self) -> None:
+        """System names should be case-insensitive."""
 
-        finally:
-            reset_unit_system(token1)
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
 
-        # Simulate second request with fresh cache
+            token = set_unit_system("SI")
 
-        clear_request_cache()
+            try:
+                assert len(w) == 0
 
-        cache2 = get_request_cache()
+                assert get_unit_system() == "si"
 
-        assert len(cache2) == 0  # Fresh cache
+            finally:
+                reset_unit_system(token)
 
 
 class TestAsyncConcurrency:
@@ -220,8 +198,6 @@ class TestAsyncConcurrency:
 
             token = set_unit_system("imperial")
 
-            clear_request_cache()
-
             try:
                 await asyncio.sleep(0.01)  # Simulate some async work
 
@@ -235,8 +211,6 @@ class TestAsyncConcurrency:
 
             token = set_unit_system("si")
 
-            clear_request_cache()
-
             try:
                 await asyncio.sleep(0.01)  # Simulate some async work
 
@@ -281,8 +255,6 @@ class TestAsyncConcurrency:
 
             token = set_unit_system("imperial")
 
-            clear_request_cache()
-
             try:
                 await asyncio.sleep(0.005)
 
@@ -298,8 +270,6 @@ class TestAsyncConcurrency:
 
             token = set_unit_system("si")
 
-            clear_request_cache()
-
             try:
                 await asyncio.sleep(0.005)
 
@@ -371,27 +341,22 @@ class TestAsyncConcurrency:
         assert results == ["imperial", "si", "imperial"]
 
     @pytest.mark.asyncio
-    async def test_cache_isolation_between_tasks(self) -> None:
-        """Each async task should have isolated cache."""
+    async def test_conversion_isolation_between_tasks(self) -> None:
+        """Each async task should convert with its own unit system."""
 
-        cache_sizes: dict[str, int] = {}
+        lengths: dict[str, float] = {}
 
-        async def task_with_conversions(task_id: str) -> None:
-            clear_request_cache()
+        class TestModel(BaseModel):
+            pressure: PintGlass("pressure", "Input")
+            length: PintGlass("length", "Input")
 
+        async def task_with_conversions(task_id: str) -> None:
             token = set_unit_system("imperial" if task_id.startswith("a") else "si")
 
             try:
-
-                class TestModel(BaseModel):
-                    pressure: PintGlass("pressure", "Input")
-                    length: PintGlass("length", "Input")
-
-                _ = TestModel(pressure=100, length=50)
-
                 await asyncio.sleep(0.005)
 
-                cache_sizes[task_id] = len(get_request_cache())
+                lengths[task_id] = TestModel(pressure=100, length=10).length
 
             finally:
                 reset_unit_system(token)
@@ -402,7 +367,8 @@ class TestAsyncConcurrency:
 
         await asyncio.gather(*tasks)
 
-        # All tasks should have non-zero cache (conversions happened)
+        # Imperial tasks: 10 ft -> 3.048 m, SI tasks: 10 m -> 10 m
 
-        for task_id, size in cache_sizes.items():
-            assert size > 0, f"Task {task_id} had empty cache"
+        for task_id, length in lengths.items():
+            expected = 3.048 if task_id.startswith("a") else 10.0
+            assert abs(length - expected) < 0.001, f"Task {task_id} leaked: {length}"
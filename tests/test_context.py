@@ -1,12 +1,18 @@
 """Tests for pint_glass.context module."""
 
+import asyncio
+
+import pytest
+
 from pint_glass.context import (
     get_unit_system,
+    make_system_context,
     reset_unit_system,
     set_unit_system,
     unit_context,
+    unit_system,
 )
-from pint_glass.dimensions import DEFAULT_SYSTEM
+from pint_glass.dimensions import DEFAULT_SYSTEM, FLAT_TARGETS
 
 
 class TestUnitContext:
@@ -66,6 +72,25 @@ class TestSetUnitSystem:
         assert token is not None
         unit_context.reset(token)
 
+    @pytest.mark.parametrize("spelling", ["engg_si", "ENGG_SI", "Engg_Si", "eNgG_sI"])
+    def test_normalizes_case(self, spelling: str) -> None:
+        """Any casing of a supported system should resolve to its canonical name."""
+        token = set_unit_system(spelling)
+        try:
+            assert unit_context.get() == "engg_si"
+        finally:
+            unit_context.reset(token)
+
+    @pytest.mark.parametrize("spelling", ["si", "SI", "sI"])
+    def test_stores_shared_canonical_string(self, spelling: str) -> None:
+        """Every spelling should store the same string object as FLAT_TARGETS."""
+        (canonical,) = {s for _, s in FLAT_TARGETS if s == "si"}
+        token = set_unit_system(spelling)
+        try:
+            assert unit_context.get() is canonical
+        finally:
+            unit_context.reset(token)
+
     def test_multiple_sets(self) -> None:
         """Multiple sets should each return valid tokens."""
         token1 = set_unit_system("si")
@@ -93,3 +118,68 @@ class TestResetUnitSystem:
         assert get_unit_system() == "si"
         reset_unit_system(token)
         assert get_unit_system() == DEFAULT_SYSTEM
+
+
+class TestUnitSystemContextManager:
+    """Tests for the unit_system context manager."""
+
+    def test_sets_system_inside_block(self) -> None:
+        """The system should be set inside the block and yielded."""
+        with unit_system("IMPERIAL") as system:
+            assert system == "imperial"
+            assert get_unit_system() == "imperial"
+
+    def test_restores_previous_system(self) -> None:
+        """The previous system should be restored after the block."""
+        with unit_system("si"):
+            with unit_system("us"):
+                assert get_unit_system() == "us"
+            assert get_unit_system() == "si"
+        assert get_unit_system() == DEFAULT_SYSTEM
+
+    def test_restores_on_exception(self) -> None:
+        """The previous system should be restored even if the block raises."""
+        with pytest.raises(RuntimeError), unit_system("imperial"):
+            raise RuntimeError
+        assert get_unit_system() == DEFAULT_SYSTEM
+
+
+class TestMakeSystemContext:
+    """Tests for make_system_context helper function."""
+
+    def test_context_has_system_set(self) -> None:
+        """Code run in the context should see the given unit system."""
+        ctx = make_system_context("imperial")
+        assert ctx.run(get_unit_system) == "imperial"
+
+    def test_does_not_touch_current_context(self) -> None:
+        """Building the context should leave the caller's system unchanged."""
+        make_system_context("si")
+        assert get_unit_system() == DEFAULT_SYSTEM
+
+    def test_does_not_inherit_current_context(self) -> None:
+        """The context starts empty rather than as a copy of the caller's."""
+        token = set_unit_system("imperial")
+        try:
+            ctx = make_system_context("si")
+            assert list(ctx) == [unit_context]
+        finally:
+            reset_unit_system(token)
+
+    def test_unknown_system_falls_back_to_default(self) -> None:
+        """Unknown systems should fall back like set_unit_system."""
+        with pytest.warns(UserWarning):
+            ctx = make_system_context("metric")
+        assert ctx.run(get_unit_system) == DEFAULT_SYSTEM
+
+    @pytest.mark.asyncio
+    async def test_task_starts_configured(self) -> None:
+        """A task created with the context should run under its system."""
+
+        async def current_system() -> str:
+            return get_unit_system()
+
+        ctx = make_system_context("imperial")
+        result = await asyncio.create_task(current_system(), context=ctx.copy())
+        assert result == "imperial"
+        assert get_unit_system() == DEFAULT_SYSTEM
@@ -1,15 +1,26 @@
 """Tests for pint_glass.core module."""
 
+import threading
+import time
+
 import pytest
 
+from pint_glass import core
 from pint_glass.core import (
+    _NORMALIZED,
+    _affine_factors,
+    _build_factor_tables,
+    _parse_unit,
     convert_from_base,
+    convert_from_base_array,
     convert_to_base,
+    convert_to_base_array,
     get_base_unit,
     get_preferred_unit,
+    get_preferred_unit_obj,
     ureg,
 )
-from pint_glass.dimensions import DEFAULT_SYSTEM, TARGET_DIMENSIONS
+from pint_glass.dimensions import DEFAULT_SYSTEM, FLAT_TARGETS, TARGET_DIMENSIONS
 from pint_glass.exceptions import UnitConversionError, UnsupportedDimensionError
 
 
@@ -60,6 +71,15 @@ class TestGetPreferredUnit:
         assert get_preferred_unit("pressure", "Imperial") == "psi"
         assert get_preferred_unit("pressure", "SI") == "pascal"
 
+    @pytest.mark.parametrize(
+        "dimension",
+        ["mass_flow_rate", "MASS_FLOW_RATE", "mass flow rate", "Mass Flow Rate"],
+    )
+    def test_common_dimension_spellings_are_precomputed(self, dimension: str) -> None:
+        """Common spellings should resolve without the slow normalization path."""
+        assert _NORMALIZED[dimension] == "mass_flow_rate"
+        assert get_preferred_unit(dimension, "si") == "kilogram / second"
+
     def test_unknown_dimension_raises(self) -> None:
         """Unknown dimension should raise UnsupportedDimensionError."""
         with pytest.raises(
@@ -74,6 +94,25 @@ class TestGetPreferredUnit:
         assert result == "bar"
 
 
+class TestGetPreferredUnitObj:
+    """Tests for get_preferred_unit_obj function."""
+
+    def test_returns_parsed_unit(self) -> None:
+        """Should return the pint Unit for the preferred unit string."""
+        unit = get_preferred_unit_obj("pressure", "imperial")
+        assert unit == ureg.Unit("psi")
+
+    def test_unit_is_cached(self) -> None:
+        """Every spelling should return the same Unit object."""
+        unit = get_preferred_unit_obj("mass_flow_rate", "si")
+        assert get_preferred_unit_obj("Mass Flow Rate", "SI") is unit
+
+    def test_unknown_dimension_raises(self) -> None:
+        """Unknown dimension should raise UnsupportedDimensionError."""
+        with pytest.raises(UnsupportedDimensionError):
+            get_preferred_unit_obj("unknown", "si")
+
+
 class TestGetBaseUnit:
     """Tests for get_base_unit function."""
 
@@ -122,19 +161,9 @@ class TestConvertToBase:
         assert result == 100.0
 
     def test_invalid_conversion_raises(self) -> None:
-        """Should raise UnitConversionError for invalid conversions."""
-        from unittest.mock import patch
-
-        import pint
-
-        # Mock the Quantity.to method to raise a DimensionalityError
-        with patch.object(
-            pint.Quantity,
-            "to",
-            side_effect=pint.DimensionalityError("meter", "second"),
-        ):
-            with pytest.raises(UnitConversionError, match="Conversion failed"):
-                convert_to_base(100, "pressure", "imperial")
+        """Should raise UnitConversionError for incompatible units."""
+        with pytest.raises(UnitConversionError, match="Conversion failed"):
+            _affine_factors("pressure", "psi", "second")
 
 
 class TestConvertFromBase:
@@ -166,6 +195,138 @@ class TestConvertFromBase:
         assert result == 100.0
 
 
+class TestAffineFactors:
+    """Tests for precomputed scale/offset conversion factors."""
+
+    def test_linear_unit_has_no_offset(self) -> None:
+        """Multiplicative units should convert with a zero offset."""
+        scale, offset = _affine_factors("length", "foot", "meter")
+        assert abs(scale - 0.3048) < 1e-12
+        assert offset == 0.0
+
+    def test_offset_unit_recovers_affine_map(self) -> None:
+        """Offset units like degF should yield both scale and offset."""
+        scale, offset = _affine_factors("temperature", "degF", "kelvin")
+        assert abs(scale - 5 / 9) < 1e-15
+        assert abs(offset - 255.372222) < 1e-6
+
+    def test_offset_unit_round_trip_is_precise(self) -> None:
+        """Offset-unit round trips should not lose precision to the offset."""
+        base = convert_to_base(68.0, "temperature", "imperial")
+        assert abs(convert_from_base(base, "temperature", "imperial") - 68.0) < 1e-12
+
+    def test_units_are_parsed_once(self) -> None:
+        """Building the tables should leave every unit in the parse cache."""
+        _build_factor_tables()
+        misses = _parse_unit.cache_info().misses
+        for unit in FLAT_TARGETS.values():
+            assert _parse_unit(unit) is _parse_unit(unit)
+        assert _parse_unit.cache_info().misses == misses
+
+
+@pytest.fixture
+def empty_factor_tables():
+    """Empty the factor tables for a test, restoring them afterwards."""
+    saved = dict(core._FACTORS_TO_BASE), dict(core._FACTORS_FROM_BASE)
+    core._FACTORS_TO_BASE.clear()
+    core._FACTORS_FROM_BASE.clear()
+    yield
+    core._FACTORS_TO_BASE.update(saved[0])
+    core._FACTORS_FROM_BASE.update(saved[1])
+
+
+@pytest.mark.usefixtures("empty_factor_tables")
+class TestLazyFactorTables:
+    """Tests for the one-time, first-use build of the factor tables."""
+
+    def test_concurrent_first_conversions(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Threads racing the first build should all see complete tables."""
+        affine_factors = core._affine_factors
+
+        def slow_affine_factors(*args: str) -> tuple[float, float]:
+            time.sleep(0.0005)
+            return affine_factors(*args)
+
+        monkeypatch.setattr(core, "_affine_factors", slow_affine_factors)
+        dimensions = list(TARGET_DIMENSIONS)
+        errors: list[Exception] = []
+
+        def convert(dimension: str) -> None:
+            try:
+                convert_to_base(1.0, dimension, "imperial")
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=convert, args=(d,)) for d in dimensions]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert set(core._FACTORS_TO_BASE) == set(FLAT_TARGETS)
+
+    def test_failed_build_leaves_tables_empty(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """An error partway through the build should not publish a partial table."""
+        affine_factors = core._affine_factors
+        calls = 0
+
+        def failing_affine_factors(*args: str) -> tuple[float, float]:
+            nonlocal calls
+            calls += 1
+            if calls == 10:
+                raise UnitConversionError("boom")
+            return affine_factors(*args)
+
+        monkeypatch.setattr(core, "_affine_factors", failing_affine_factors)
+        with pytest.raises(UnitConversionError):
+            convert_to_base(1.0, "length", "imperial")
+
+        assert core._FACTORS_TO_BASE == {}
+        assert core._FACTORS_FROM_BASE == {}
+
+
+class TestArrayConversion:
+    """Tests for vectorized convert_to_base_array / convert_from_base_array."""
+
+    def test_to_base_matches_scalar(self) -> None:
+        """Array conversion should match element-wise scalar conversion."""
+        np = pytest.importorskip("numpy")
+        values = [0.0, 32.0, 212.0, -40.0]
+        result = convert_to_base_array(values, "temperature", "imperial")
+        expected = [convert_to_base(v, "temperature", "imperial") for v in values]
+        assert result.dtype == np.float64
+        assert np.allclose(result, expected)
+
+    def test_from_base_matches_scalar(self) -> None:
+        """Array conversion from base should match scalar conversion."""
+        np = pytest.importorskip("numpy")
+        values = np.array([101325.0, 0.0, 689476.0])
+        result = convert_from_base_array(values, "pressure", "imperial")
+        expected = [convert_from_base(v, "pressure", "imperial") for v in values]
+        assert np.allclose(result, expected)
+
+    def test_in_place_with_out(self) -> None:
+        """Passing the input array as out should convert it in place."""
+        np = pytest.importorskip("numpy")
+        values = np.array([32.0, 212.0])
+        result = convert_to_base_array(values, "temperature", "imperial", out=values)
+        assert result is values
+        assert np.allclose(values, [273.15, 373.15])
+
+    def test_round_trip(self) -> None:
+        """Converting an array to base and back should preserve it."""
+        np = pytest.importorskip("numpy")
+        values = np.linspace(-100.0, 100.0, 50)
+        base = convert_to_base_array(values, "Mass Flow Rate", "engg_field")
+        result = convert_from_base_array(base, "Mass Flow Rate", "engg_field")
+        assert np.allclose(result, values)
+
+
 class TestRoundTrip:
     """Tests for round-trip conversions."""
 
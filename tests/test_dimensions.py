@@ -1,9 +1,19 @@
 """Tests for pint_glass.dimensions module."""
 
+import subprocess
+import sys
+
 import pytest
 
-from pint_glass.core import ureg
-from pint_glass.dimensions import TARGET_DIMENSIONS, UNIT_SYSTEMS
+from pint_glass.core import _parse_unit
+from pint_glass.dimensions import (
+    _TARGET_DIMENSIONS_RAW,
+    FLAT_TARGETS,
+    TARGET_DIMENSIONS,
+    UNIT_SYSTEMS,
+    UnitMapping,
+    get_pretty_dimensions,
+)
 
 
 class TestTargetDimensionsStructure:
@@ -18,12 +28,16 @@ class TestTargetDimensionsStructure:
                 f"Has: {set(systems.keys())}, Required: {required_systems}"
             )
 
+    def test_unit_systems_match_unit_mapping(self) -> None:
+        """UNIT_SYSTEMS should list exactly the keys of the UnitMapping TypedDict."""
+        assert set(UnitMapping.__annotations__) == UNIT_SYSTEMS
+
     def test_all_units_are_valid_pint_units(self) -> None:
         """All unit strings in TARGET_DIMENSIONS should be valid pint units."""
         for dimension, systems in TARGET_DIMENSIONS.items():
             for system, unit_str in systems.items():
                 try:
-                    ureg.Quantity(1, unit_str)
+                    _parse_unit(unit_str)
                 except Exception as e:
                     pytest.fail(
                         f"Invalid unit '{unit_str}' for dimension '{dimension}' "
@@ -82,3 +96,55 @@ class TestTargetDimensionsStructure:
         assert temp_units["us"] == "°F"
         assert temp_units["si"] == "K"
         assert temp_units["cgs"] == "°C"
+
+    def test_matches_generated_pretty_dimensions(self) -> None:
+        """The stored literal must match a fresh formatting of the raw table.
+
+        If this fails, regenerate it with ``python scripts/gen_pretty_dims.py``.
+        """
+        assert get_pretty_dimensions() == TARGET_DIMENSIONS
+
+    def test_is_read_only(self) -> None:
+        """TARGET_DIMENSIONS and its unit maps should reject mutation."""
+        with pytest.raises(TypeError):
+            TARGET_DIMENSIONS["Pressure"] = {}  # type: ignore[index]
+        with pytest.raises(TypeError):
+            TARGET_DIMENSIONS["Pressure"]["si"] = "kPa"  # type: ignore[index]
+
+
+class TestFlatTargets:
+    """Tests for the flattened (dimension, system) lookup."""
+
+    def test_matches_nested_mapping(self) -> None:
+        """Every nested entry should appear under its (dimension, system) key."""
+        expected = {
+            (dim, system): unit
+            for dim, units in _TARGET_DIMENSIONS_RAW.items()
+            for system, unit in units.items()
+        }
+        assert expected == FLAT_TARGETS
+
+    def test_is_read_only(self) -> None:
+        """FLAT_TARGETS should not be mutable by callers."""
+        with pytest.raises(TypeError):
+            FLAT_TARGETS[("pressure", "si")] = "kPa"  # type: ignore[index]
+
+
+class TestImportCost:
+    """Tests that importing the package stays cheap."""
+
+    def test_import_does_not_load_pint(self) -> None:
+        """Importing pint_glass should not import pint (or build a registry)."""
+        code = "import sys, pint_glass; print('pint' in sys.modules)"
+        result = subprocess.run(  # noqa: S603
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "False"
+
+    def test_import_does_not_load_asyncio(self) -> None:
+        """Importing pint_glass should not import asyncio (only its helpers do)."""
+        code = "import sys, pint_glass; print('asyncio' in sys.modules)"
+        result = subprocess.run(  # noqa: S603
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "False"
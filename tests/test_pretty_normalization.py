@@ -7,6 +7,9 @@ from pint_glass import PintGlass
 from pint_glass.core import get_preferred_unit
 from pint_glass.dimensions import TARGET_DIMENSIONS
 
+# One test case per dimension, so a failing key does not hide the others
+PRETTY_KEYS = sorted(TARGET_DIMENSIONS)
+
 
 class TestPrettyDimensions:
     """Tests for the pretty-formatted TARGET_DIMENSIONS."""
@@ -43,46 +46,29 @@ class TestPrettyDimensions:
 class TestDimensionNormalization:
     """Tests for dimension key normalization in PintGlass/core."""
 
-    def test_all_pretty_keys_work_in_pint_glass(self) -> None:
+    @pytest.mark.parametrize("pretty_key", PRETTY_KEYS)
+    def test_all_pretty_keys_work_in_pint_glass(self, pretty_key: str) -> None:
         """PintGlass should accept all keys present in TARGET_DIMENSIONS."""
-        for pretty_key in TARGET_DIMENSIONS.keys():
-            # Should not raise
-            try:
-                _ = PintGlass(pretty_key, "Input")
-            except Exception as e:
-                pytest.fail(f"PintGlass failed for pretty key '{pretty_key}': {e}")
+        # Should not raise
+        _ = PintGlass(pretty_key, "Input")
 
-    def test_all_raw_keys_work_in_pint_glass(self) -> None:
+    @pytest.mark.parametrize("pretty_key", PRETTY_KEYS)
+    def test_all_raw_keys_work_in_pint_glass(self, pretty_key: str) -> None:
         """PintGlass should accept raw keys (lowercase, underscores)."""
-        for pretty_key in TARGET_DIMENSIONS.keys():
-            # Derive raw key: "Mass Flow Rate" -> "mass_flow_rate"
-            raw_key = pretty_key.lower().replace(" ", "_")
-            try:
-                _ = PintGlass(raw_key, "Input")
-            except Exception as e:
-                pytest.fail(f"PintGlass failed for raw key '{raw_key}': {e}")
+        # Derive raw key: "Mass Flow Rate" -> "mass_flow_rate"
+        raw_key = pretty_key.lower().replace(" ", "_")
+        _ = PintGlass(raw_key, "Input")
 
-    def test_all_caps_keys_work_in_pint_glass(self) -> None:
+    @pytest.mark.parametrize("pretty_key", PRETTY_KEYS)
+    @pytest.mark.parametrize("separator", [" ", "_"], ids=["spaces", "underscores"])
+    def test_all_caps_keys_work_in_pint_glass(
+        self, pretty_key: str, separator: str
+    ) -> None:
         """PintGlass should accept ALL CAPS keys (normalization)."""
-        for pretty_key in TARGET_DIMENSIONS.keys():
-            # Derive caps key: "Mass Flow Rate" -> "MASS_FLOW_RATE" (or "MASS FLOW RATE"?)
-            # The normalization logic in core.py is: dimension.lower().replace(" ", "_")
-            # So "MASS FLOW RATE" -> "mass flow rate" -> "mass_flow_rate".
-            # "MASS_FLOW_RATE" -> "mass_flow_rate".
-            
-            # Case 1: Spaces
-            caps_space = pretty_key.upper()
-            try:
-                _ = PintGlass(caps_space, "Input")
-            except Exception as e:
-                 pytest.fail(f"PintGlass failed for caps space key '{caps_space}': {e}")
-                 
-            # Case 2: Underscores
-            caps_underscore = pretty_key.upper().replace(" ", "_")
-            try:
-                _ = PintGlass(caps_underscore, "Input")
-            except Exception as e:
-                 pytest.fail(f"PintGlass failed for caps underscore key '{caps_underscore}': {e}")
+        # "Mass Flow Rate" -> "MASS FLOW RATE" / "MASS_FLOW_RATE", both of
+        # which core.py normalizes to "mass_flow_rate"
+        caps_key = pretty_key.upper().replace(" ", separator)
+        _ = PintGlass(caps_key, "Input")
 
 
 class TestNormalizationLogicDetailed: